@@ -2,48 +2,64 @@
 Configuration management for Stock Forensic Analysis Tool
 """
 import os
+from functools import lru_cache
+from types import SimpleNamespace
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
-
-class Config:
-    """Configuration class for the application"""
-    
-    # API Keys
-    YOU_API_KEY = os.getenv('YOU_API_KEY', '')
-    
-    # Report Configuration
-    REPORT_OUTPUT_DIR = os.getenv('REPORT_OUTPUT_DIR', 'reports')
-    
-    # Analysis Parameters
-    DEFAULT_ANALYSIS_PERIOD = os.getenv('DEFAULT_ANALYSIS_PERIOD', '1y')
-    RISK_THRESHOLD_HIGH = float(os.getenv('RISK_THRESHOLD_HIGH', '0.7'))
-    RISK_THRESHOLD_MEDIUM = float(os.getenv('RISK_THRESHOLD_MEDIUM', '0.4'))
-    
-    # You.com API Configuration
-    YOU_API_BASE_URL = "https://api.ydc-index.io"
-    YOU_API_SEARCH_ENDPOINT = "/search"
-    
-    # Forensic Analysis Thresholds
-    BENEISH_M_SCORE_THRESHOLD = -2.22  # Values > -2.22 suggest manipulation
-    ALTMAN_Z_SCORE_SAFE = 2.99  # Z > 2.99 = Safe zone
-    ALTMAN_Z_SCORE_DISTRESS = 1.81  # Z < 1.81 = Distress zone
-    
-    # Pattern Detection Parameters
-    VOLUME_SPIKE_THRESHOLD = 2.0  # 2x average volume
-    PRICE_CHANGE_THRESHOLD = 0.05  # 5% price change
-    
-    @classmethod
-    def validate(cls):
-        """Validate required configuration"""
-        if not cls.YOU_API_KEY:
-            print("WARNING: YOU_API_KEY not set. News analysis will be limited.")
-        
-        # Create reports directory if it doesn't exist
-        os.makedirs(cls.REPORT_OUTPUT_DIR, exist_ok=True)
-        
-        return True
-
-# Validate configuration on import
-Config.validate()
+
+@lru_cache(maxsize=1)
+def get_settings() -> SimpleNamespace:
+    """
+    Load and validate application settings
+
+    The environment (including .env) is read once per process; subsequent
+    calls return the cached settings object.
+
+    Returns:
+        Namespace holding all configuration values
+    """
+    # Load environment variables
+    load_dotenv()
+
+    settings = SimpleNamespace(
+        # API Keys
+        YOU_API_KEY=os.getenv('YOU_API_KEY', ''),
+
+        # Report Configuration
+        REPORT_OUTPUT_DIR=os.getenv('REPORT_OUTPUT_DIR', 'reports'),
+
+        # HTTP response cache (requires the optional requests-cache package)
+        HTTP_CACHE_ENABLED=os.getenv('HTTP_CACHE_ENABLED', 'false').lower() in ('1', 'true', 'yes'),
+        HTTP_CACHE_EXPIRE=int(os.getenv('HTTP_CACHE_EXPIRE', '3600')),  # seconds
+
+        # Analysis Parameters
+        DEFAULT_ANALYSIS_PERIOD=os.getenv('DEFAULT_ANALYSIS_PERIOD', '1y'),
+        RISK_THRESHOLD_HIGH=float(os.getenv('RISK_THRESHOLD_HIGH', '0.7')),
+        RISK_THRESHOLD_MEDIUM=float(os.getenv('RISK_THRESHOLD_MEDIUM', '0.4')),
+
+        # You.com API Configuration
+        YOU_API_BASE_URL="https://api.ydc-index.io",
+        YOU_API_SEARCH_ENDPOINT="/search",
+
+        # Forensic Analysis Thresholds
+        BENEISH_M_SCORE_THRESHOLD=-2.22,  # Values > -2.22 suggest manipulation
+        ALTMAN_Z_SCORE_SAFE=2.99,  # Z > 2.99 = Safe zone
+        ALTMAN_Z_SCORE_DISTRESS=1.81,  # Z < 1.81 = Distress zone
+
+        # Pattern Detection Parameters
+        VOLUME_SPIKE_THRESHOLD=2.0,  # 2x average volume
+        PRICE_CHANGE_THRESHOLD=0.05,  # 5% price change
+    )
+
+    # Validate required configuration
+    if not settings.YOU_API_KEY:
+        print("WARNING: YOU_API_KEY not set. News analysis will be limited.")
+
+    # Create reports directory if it doesn't exist
+    os.makedirs(settings.REPORT_OUTPUT_DIR, exist_ok=True)
+
+    return settings
+
+
+# Module-level settings object used throughout the application
+Config = get_settings()
@@ -4,25 +4,29 @@ Example usage script for Stock Forensic Analysis Tool
 Demonstrates how to use the tool programmatically
 """
 
-from src.data_fetcher import DataAggregator
+from itertools import chain
+
+from src.data_fetcher import DataAggregator, YouComNewsDataFetcher
 from src.forensic_analyzer import ForensicAnalyzer
 from src.news_analyzer import NewsAnalyzer
 from src.pattern_detector import PatternDetector
 from src.report_generator import ReportGenerator
 
 
-def analyze_stock_programmatically(symbol: str):
+def analyze_stock_programmatically(symbol: str, news_fetcher: YouComNewsDataFetcher = None):
     """
     Example of using the tool programmatically
     
     Args:
         symbol: Stock ticker symbol
+        news_fetcher: Shared news fetcher, so several symbols reuse one
+            You.com HTTP session (optional)
     """
     print(f"Analyzing {symbol}...\n")
     
     # Step 1: Fetch data
     print("1. Fetching data...")
-    aggregator = DataAggregator(symbol)
+    aggregator = DataAggregator(symbol, news_fetcher=news_fetcher)
     data = aggregator.fetch_all_data(period='1y')
     
     # Step 2: Forensic analysis
@@ -44,7 +48,7 @@ def analyze_stock_programmatically(symbol: str):
     
     # Step 3: News analysis
     print("\n3. Analyzing news...")
-    news_data = data.get('news', []) + data.get('financial_analysis', [])
+    news_data = list(chain(data.get('news') or (), data.get('financial_analysis') or ()))
     news_analyzer = NewsAnalyzer(news_data)
     news_report = news_analyzer.summarize_news()
     
@@ -94,11 +98,16 @@ def analyze_stock_programmatically(symbol: str):
 
 def main():
     """Main function"""
+    # One news fetcher (and its keep-alive session) is shared by both
+    # examples; each symbol's data is still fetched concurrently inside
+    # DataAggregator, and yfinance shares a single session across Tickers
+    news_fetcher = YouComNewsDataFetcher()
+    
     # Example 1: Analyze Apple
     print("=" * 70)
     print("EXAMPLE 1: Analyzing Apple (AAPL)")
     print("=" * 70)
-    analyze_stock_programmatically('AAPL')
+    analyze_stock_programmatically('AAPL', news_fetcher)
     
     print("\n\n")
     
@@ -106,7 +115,7 @@ def main():
     print("=" * 70)
     print("EXAMPLE 2: Analyzing Tesla (TSLA)")
     print("=" * 70)
-    analyze_stock_programmatically('TSLA')
+    analyze_stock_programmatically('TSLA', news_fetcher)
 
 
 if __name__ == '__main__':
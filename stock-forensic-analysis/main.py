@@ -11,14 +11,19 @@ This tool performs comprehensive forensic analysis on stocks using:
 
 import sys
 import argparse
+import bisect
+import logging
 from datetime import datetime
+from itertools import chain
 
 from config import Config
-from src.data_fetcher import DataAggregator
-from src.forensic_analyzer import ForensicAnalyzer
-from src.news_analyzer import NewsAnalyzer
-from src.pattern_detector import PatternDetector
-from src.report_generator import ReportGenerator
+
+# Weights for the forensic, news and pattern risk scores (in that order)
+RISK_WEIGHTS = (0.5, 0.3, 0.2)
+
+# Overall risk levels and the score cutoffs separating them
+RISK_LEVELS = ('LOW', 'MEDIUM', 'HIGH')
+RISK_CUTOFFS = (Config.RISK_THRESHOLD_MEDIUM, Config.RISK_THRESHOLD_HIGH)
 
 
 def print_banner():
@@ -46,43 +51,58 @@ def analyze_stock(symbol: str, period: str = '1y', you_api_key: str = None) -> d
     Returns:
         Dictionary containing complete analysis results
     """
-    print(f"\n{'='*70}")
-    print(f"Starting forensic analysis for {symbol}")
-    print(f"{'='*70}\n")
+    # Imported here so that argparse-only paths (e.g. --help) skip loading
+    # yfinance/pandas/numpy entirely
+    from src.data_fetcher import DataAggregator
+    from src.forensic_analyzer import ForensicAnalyzer
+    from src.news_analyzer import NewsAnalyzer
+    from src.pattern_detector import PatternDetector
+    from src.utils import ProgressReporter
+
+    # Progress lines are buffered and written once per phase
+    reporter = ProgressReporter()
+    
+    reporter.emit(f"\n{'='*70}")
+    reporter.emit(f"Starting forensic analysis for {symbol}")
+    reporter.emit(f"{'='*70}\n")
     
     # Step 1: Fetch all data
-    print("STEP 1: Fetching data from APIs...")
-    print("-" * 70)
+    reporter.emit("STEP 1: Fetching data from APIs...")
+    reporter.emit("-" * 70)
+    reporter.flush()
     
     aggregator = DataAggregator(symbol, you_api_key)
     data = aggregator.fetch_all_data(period)
     
     if not data.get('stock_info'):
-        print(f"\n❌ Error: Could not fetch data for {symbol}")
-        print("Please verify the ticker symbol is correct.")
+        reporter.emit(f"\n❌ Error: Could not fetch data for {symbol}")
+        reporter.emit("Please verify the ticker symbol is correct.")
+        reporter.flush()
         return None
     
-    print(f"✓ Data fetched successfully for {data['stock_info'].get('company_name', symbol)}")
+    reporter.emit(f"✓ Data fetched successfully for {data['stock_info'].get('company_name', symbol)}")
     
     # Step 2: Perform forensic analysis
-    print("\nSTEP 2: Performing forensic analysis...")
-    print("-" * 70)
+    reporter.emit("\nSTEP 2: Performing forensic analysis...")
+    reporter.emit("-" * 70)
+    reporter.flush()
     
     forensic_analyzer = ForensicAnalyzer(data)
     forensic_report = forensic_analyzer.generate_forensic_report()
     
-    print(f"✓ Forensic analysis completed")
-    print(f"  - Beneish M-Score: {forensic_report['beneish_m_score'].get('score', 'N/A')} "
-          f"({forensic_report['beneish_m_score'].get('risk_level', 'UNKNOWN')})")
-    print(f"  - Altman Z-Score: {forensic_report['altman_z_score'].get('score', 'N/A')} "
-          f"({forensic_report['altman_z_score'].get('risk_level', 'UNKNOWN')})")
-    print(f"  - Red Flags Detected: {forensic_report['financial_red_flags'].get('total_flags', 0)}")
+    reporter.emit(f"✓ Forensic analysis completed")
+    reporter.emit(f"  - Beneish M-Score: {forensic_report['beneish_m_score'].get('score', 'N/A')} "
+                  f"({forensic_report['beneish_m_score'].get('risk_level', 'UNKNOWN')})")
+    reporter.emit(f"  - Altman Z-Score: {forensic_report['altman_z_score'].get('score', 'N/A')} "
+                  f"({forensic_report['altman_z_score'].get('risk_level', 'UNKNOWN')})")
+    reporter.emit(f"  - Red Flags Detected: {forensic_report['financial_red_flags'].get('total_flags', 0)}")
     
     # Step 3: Analyze news
-    print("\nSTEP 3: Analyzing news articles...")
-    print("-" * 70)
+    reporter.emit("\nSTEP 3: Analyzing news articles...")
+    reporter.emit("-" * 70)
+    reporter.flush()
     
-    news_data = data.get('news', []) + data.get('financial_analysis', [])
+    news_data = list(chain(data.get('news') or (), data.get('financial_analysis') or ()))
     news_analyzer = NewsAnalyzer(news_data)
     news_report = news_analyzer.summarize_news()
     
@@ -90,56 +110,48 @@ def analyze_stock(symbol: str, period: str = '1y', you_api_key: str = None) -> d
     critical_news = news_analyzer.get_critical_news()
     news_report['critical_news'] = critical_news
     
-    print(f"✓ News analysis completed")
-    print(f"  - Articles Analyzed: {news_report['total_articles_analyzed']}")
-    print(f"  - Sentiment: {news_report['sentiment_analysis'].get('sentiment', 'NEUTRAL')}")
-    print(f"  - Risk Level: {news_report['risk_signals'].get('risk_level', 'UNKNOWN')}")
-    print(f"  - Critical News Items: {len(critical_news)}")
+    reporter.emit(f"✓ News analysis completed")
+    reporter.emit(f"  - Articles Analyzed: {news_report['total_articles_analyzed']}")
+    reporter.emit(f"  - Sentiment: {news_report['sentiment_analysis'].get('sentiment', 'NEUTRAL')}")
+    reporter.emit(f"  - Risk Level: {news_report['risk_signals'].get('risk_level', 'UNKNOWN')}")
+    reporter.emit(f"  - Critical News Items: {len(critical_news)}")
     
     # Step 4: Detect patterns
-    print("\nSTEP 4: Detecting price and volume patterns...")
-    print("-" * 70)
+    reporter.emit("\nSTEP 4: Detecting price and volume patterns...")
+    reporter.emit("-" * 70)
+    reporter.flush()
     
     historical_data = data.get('historical_data')
     pattern_detector = PatternDetector(historical_data)
     pattern_report = pattern_detector.generate_pattern_report()
     
-    print(f"✓ Pattern detection completed")
-    print(f"  - Volume Spikes: {pattern_report['volume_spikes'].get('spikes_detected', 0)}")
-    print(f"  - Price Anomalies: {pattern_report['price_anomalies'].get('anomalies_detected', 0)}")
-    print(f"  - Volatility: {pattern_report['volatility_metrics'].get('annualized_volatility', 0):.2f}%")
+    reporter.emit(f"✓ Pattern detection completed")
+    reporter.emit(f"  - Volume Spikes: {pattern_report['volume_spikes'].get('spikes_detected', 0)}")
+    reporter.emit(f"  - Price Anomalies: {pattern_report['price_anomalies'].get('anomalies_detected', 0)}")
+    reporter.emit(f"  - Volatility: {pattern_report['volatility_metrics'].get('annualized_volatility', 0):.2f}%")
     
     # Step 5: Calculate overall risk
-    print("\nSTEP 5: Calculating overall risk assessment...")
-    print("-" * 70)
-    
-    # Aggregate risk scores
-    risk_scores = []
-    
-    # Forensic risk
-    forensic_risk = forensic_report.get('overall_risk_score', 0.5)
-    risk_scores.append(forensic_risk)
-    
-    # News risk
-    news_risk = news_report['risk_signals'].get('risk_score', 0)
-    risk_scores.append(news_risk)
-    
-    # Pattern risk
-    pattern_risk = pattern_report.get('overall_pattern_risk_score', 0)
-    risk_scores.append(pattern_risk)
+    reporter.emit("\nSTEP 5: Calculating overall risk assessment...")
+    reporter.emit("-" * 70)
+    
+    # Aggregate risk scores (forensic, news, pattern); all three reports
+    # always populate these keys
+    risk_scores = (
+        forensic_report['overall_risk_score'],
+        news_report['risk_signals']['risk_score'],
+        pattern_report['overall_pattern_risk_score'],
+    )
     
     # Calculate weighted average (forensic analysis weighted more heavily)
-    overall_risk_score = (
-        forensic_risk * 0.5 +  # 50% weight
-        news_risk * 0.3 +       # 30% weight
-        pattern_risk * 0.2      # 20% weight
-    )
+    overall_risk_score = sum(score * weight for score, weight in zip(risk_scores, RISK_WEIGHTS))
     
-    overall_risk_level = 'HIGH' if overall_risk_score > 0.6 else 'MEDIUM' if overall_risk_score > 0.3 else 'LOW'
+    # Map the score onto the configured risk thresholds
+    overall_risk_level = RISK_LEVELS[bisect.bisect_right(RISK_CUTOFFS, overall_risk_score)]
     
-    print(f"✓ Overall risk assessment completed")
-    print(f"  - Overall Risk Score: {overall_risk_score:.2f}")
-    print(f"  - Overall Risk Level: {overall_risk_level}")
+    reporter.emit(f"✓ Overall risk assessment completed")
+    reporter.emit(f"  - Overall Risk Score: {overall_risk_score:.2f}")
+    reporter.emit(f"  - Overall Risk Level: {overall_risk_level}")
+    reporter.flush()
     
     # Compile complete analysis
     complete_analysis = {
@@ -218,6 +230,8 @@ Examples:
     
     args = parser.parse_args()
     
+    logging.basicConfig(level=logging.WARNING, format='%(levelname)s [%(name)s] %(message)s')
+    
     # Print banner
     print_banner()
     
@@ -239,6 +253,7 @@ Examples:
             print("\nSTEP 6: Generating reports...")
             print("-" * 70)
             
+            from src.report_generator import ReportGenerator
             report_gen = ReportGenerator(analysis_result)
             
             # Print summary to console
@@ -1,15 +1,105 @@
 """
 Data fetching module for Yahoo Finance and You.com API
+
+yfinance, requests and pandas are imported lazily inside the methods that
+need them, so importing this module (e.g. for ``main.py --help``) stays cheap.
 """
-import yfinance as yf
-import requests
-import pandas as pd
-from typing import Dict, List, Optional, Any
+from __future__ import annotations
+
+import os
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple, TYPE_CHECKING
 from datetime import datetime, timedelta
+import threading
 import time
 
 from config import Config
 
+# orjson parses API responses several times faster; fall back to the stdlib
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+# yfinance Ticker attributes memoized by YahooFinanceDataFetcher
+_CACHED_TICKER_ATTRS = ('info', 'balance_sheet', 'financials', 'cashflow')
+
+# Daily history columns consumed downstream (see PatternDetector)
+HISTORY_COLUMNS = ('Open', 'Close', 'Volume')
+
+# Balance sheet rows used by get_key_ratios, in unpacking order
+_BALANCE_SHEET_RATIO_ROWS = ['Total Current Assets', 'Total Current Liabilities', 'Total Assets']
+
+# Projection of yfinance info keys onto get_stock_info fields:
+# (output field, info key, default)
+_STOCK_INFO_FIELDS = (
+    ('company_name', 'longName', 'N/A'),
+    ('sector', 'sector', 'N/A'),
+    ('industry', 'industry', 'N/A'),
+    ('market_cap', 'marketCap', 0),
+    ('current_price', 'currentPrice', 0),
+    ('previous_close', 'previousClose', 0),
+    ('volume', 'volume', 0),
+    ('average_volume', 'averageVolume', 0),
+    ('pe_ratio', 'trailingPE', 0),
+    ('forward_pe', 'forwardPE', 0),
+    ('dividend_yield', 'dividendYield', 0),
+    ('beta', 'beta', 0),
+    ('52_week_high', 'fiftyTwoWeekHigh', 0),
+    ('52_week_low', 'fiftyTwoWeekLow', 0),
+)
+
+
+def _create_http_session():
+    """
+    Create the HTTP session used for You.com requests
+    
+    When HTTP_CACHE_ENABLED is set and requests-cache is installed, responses
+    are persisted to an SQLite cache in the reports directory so repeated
+    analyses of the same symbol don't hit the network again. yfinance is not
+    routed through this cache: it manages its own session and rejects
+    caching sessions.
+    
+    The session keeps connections alive across queries and retries
+    transient failures (429/5xx) with a short backoff.
+    
+    Returns:
+        A requests.Session (or requests_cache.CachedSession)
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = None
+    if Config.HTTP_CACHE_ENABLED:
+        try:
+            from requests_cache import CachedSession
+        except ImportError:
+            logger.warning("HTTP_CACHE_ENABLED is set but requests-cache is not installed; "
+                           "continuing without response caching")
+        else:
+            session = CachedSession(
+                os.path.join(Config.REPORT_OUTPUT_DIR, '.http_cache'),
+                backend='sqlite',
+                expire_after=Config.HTTP_CACHE_EXPIRE,
+            )
+    
+    if session is None:
+        session = requests.Session()
+    
+    retries = Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retries)
+    session.mount('https://', adapter)
+    
+    return session
+
 
 class YahooFinanceDataFetcher:
     """Fetch stock data from Yahoo Finance"""
@@ -21,8 +111,51 @@ class YahooFinanceDataFetcher:
         Args:
             symbol: Stock ticker symbol
         """
+        import yfinance as yf
+
         self.symbol = symbol.upper()
         self.ticker = yf.Ticker(self.symbol)
+        
+        # Each ticker attribute below triggers a Yahoo round-trip, so it is
+        # fetched once and reused. Per-attribute locks keep concurrent callers
+        # (see DataAggregator.fetch_all_data) from requesting it twice.
+        self._cache: Dict[str, Any] = {}
+        self._locks = {name: threading.Lock() for name in _CACHED_TICKER_ATTRS}
+    
+    def _cached_ticker_attr(self, name: str) -> Any:
+        """
+        Fetch a ticker attribute once and memoize it on the instance
+        
+        Args:
+            name: Attribute name on the yfinance Ticker
+            
+        Returns:
+            The (cached) attribute value
+        """
+        with self._locks[name]:
+            if name not in self._cache:
+                self._cache[name] = getattr(self.ticker, name)
+            return self._cache[name]
+    
+    @property
+    def info(self) -> Dict[str, Any]:
+        """Ticker info dictionary (fetched once)"""
+        return self._cached_ticker_attr('info')
+    
+    @property
+    def balance_sheet(self) -> pd.DataFrame:
+        """Annual balance sheet (fetched once)"""
+        return self._cached_ticker_attr('balance_sheet')
+    
+    @property
+    def income_stmt(self) -> pd.DataFrame:
+        """Annual income statement (fetched once)"""
+        return self._cached_ticker_attr('financials')
+    
+    @property
+    def cashflow(self) -> pd.DataFrame:
+        """Annual cash flow statement (fetched once)"""
+        return self._cached_ticker_attr('cashflow')
     
     def get_stock_info(self) -> Dict[str, Any]:
         """
@@ -32,43 +165,38 @@ class YahooFinanceDataFetcher:
             Dictionary containing stock info
         """
         try:
-            info = self.ticker.info
-            return {
-                'symbol': self.symbol,
-                'company_name': info.get('longName', 'N/A'),
-                'sector': info.get('sector', 'N/A'),
-                'industry': info.get('industry', 'N/A'),
-                'market_cap': info.get('marketCap', 0),
-                'current_price': info.get('currentPrice', 0),
-                'previous_close': info.get('previousClose', 0),
-                'volume': info.get('volume', 0),
-                'average_volume': info.get('averageVolume', 0),
-                'pe_ratio': info.get('trailingPE', 0),
-                'forward_pe': info.get('forwardPE', 0),
-                'dividend_yield': info.get('dividendYield', 0),
-                'beta': info.get('beta', 0),
-                '52_week_high': info.get('fiftyTwoWeekHigh', 0),
-                '52_week_low': info.get('fiftyTwoWeekLow', 0),
-            }
-        except Exception as e:
-            print(f"Error fetching stock info: {e}")
+            info = self.info
+            stock_info = {'symbol': self.symbol}
+            stock_info.update(
+                (field, info.get(source_key, default))
+                for field, source_key, default in _STOCK_INFO_FIELDS
+            )
+            return stock_info
+        except Exception:
+            # yfinance surfaces network, parsing and its own YFException errors
+            # alike, so the Yahoo fetchers keep a broad boundary and log it
+            logger.exception("Error fetching stock info for %s", self.symbol)
             return {}
     
-    def get_historical_data(self, period: str = '1y') -> pd.DataFrame:
+    def get_historical_data(self, period: str = '1y',
+                            columns: Tuple[str, ...] = HISTORY_COLUMNS) -> pd.DataFrame:
         """
         Get historical price data
         
         Args:
             period: Time period (e.g., '1y', '6m', '3m')
+            columns: Price/volume columns to keep (defaults to those used by
+                PatternDetector)
             
         Returns:
             DataFrame with historical data
         """
         try:
-            hist = self.ticker.history(period=period)
-            return hist
-        except Exception as e:
-            print(f"Error fetching historical data: {e}")
+            hist = self.ticker.history(period=period, interval='1d', actions=False, prepost=False)
+            return hist[[col for col in columns if col in hist.columns]]
+        except Exception:
+            logger.exception("Error fetching historical data for %s", self.symbol)
+            import pandas as pd
             return pd.DataFrame()
     
     def get_financials(self) -> Dict[str, pd.DataFrame]:
@@ -80,15 +208,15 @@ class YahooFinanceDataFetcher:
         """
         try:
             return {
-                'income_statement': self.ticker.financials,
-                'balance_sheet': self.ticker.balance_sheet,
-                'cash_flow': self.ticker.cashflow,
+                'income_statement': self.income_stmt,
+                'balance_sheet': self.balance_sheet,
+                'cash_flow': self.cashflow,
                 'quarterly_financials': self.ticker.quarterly_financials,
                 'quarterly_balance_sheet': self.ticker.quarterly_balance_sheet,
                 'quarterly_cashflow': self.ticker.quarterly_cashflow,
             }
-        except Exception as e:
-            print(f"Error fetching financials: {e}")
+        except Exception:
+            logger.exception("Error fetching financials for %s", self.symbol)
             return {}
     
     def get_key_ratios(self) -> Dict[str, float]:
@@ -98,10 +226,12 @@ class YahooFinanceDataFetcher:
         Returns:
             Dictionary of financial ratios
         """
+        from src.utils import safe_divide
+
         try:
-            info = self.ticker.info
-            balance_sheet = self.ticker.balance_sheet
-            income_stmt = self.ticker.financials
+            info = self.info
+            balance_sheet = self.balance_sheet
+            income_stmt = self.income_stmt
             
             ratios = {}
             
@@ -111,30 +241,27 @@ class YahooFinanceDataFetcher:
             ratios['roe'] = info.get('returnOnEquity', 0) * 100
             ratios['roa'] = info.get('returnOnAssets', 0) * 100
             
-            # Liquidity Ratios
+            # Pull the statement rows we need in one reindex per statement;
+            # missing rows come back as NaN and are handled by safe_divide
             if not balance_sheet.empty:
-                try:
-                    current_assets = balance_sheet.loc['Total Current Assets'].iloc[0]
-                    current_liabilities = balance_sheet.loc['Total Current Liabilities'].iloc[0]
-                    ratios['current_ratio'] = current_assets / current_liabilities if current_liabilities != 0 else 0
-                except:
-                    ratios['current_ratio'] = 0
+                current_assets, current_liabilities, total_assets = (
+                    balance_sheet.reindex(_BALANCE_SHEET_RATIO_ROWS).iloc[:, 0].to_numpy()
+                )
+                
+                # Liquidity Ratios
+                ratios['current_ratio'] = safe_divide(current_assets, current_liabilities)
             
             # Leverage Ratios
             ratios['debt_to_equity'] = info.get('debtToEquity', 0) / 100
             
             # Efficiency Ratios
             if not income_stmt.empty and not balance_sheet.empty:
-                try:
-                    revenue = income_stmt.loc['Total Revenue'].iloc[0]
-                    total_assets = balance_sheet.loc['Total Assets'].iloc[0]
-                    ratios['asset_turnover'] = revenue / total_assets if total_assets != 0 else 0
-                except:
-                    ratios['asset_turnover'] = 0
+                revenue = income_stmt.reindex(['Total Revenue']).iloc[0, 0]
+                ratios['asset_turnover'] = safe_divide(revenue, total_assets)
             
             return ratios
-        except Exception as e:
-            print(f"Error calculating ratios: {e}")
+        except Exception:
+            logger.exception("Error calculating ratios for %s", self.symbol)
             return {}
     
     def get_shareholding_pattern(self) -> Dict[str, Any]:
@@ -145,7 +272,7 @@ class YahooFinanceDataFetcher:
             Dictionary with shareholding details
         """
         try:
-            info = self.ticker.info
+            info = self.info
             major_holders = self.ticker.major_holders
             institutional_holders = self.ticker.institutional_holders
             
@@ -156,13 +283,14 @@ class YahooFinanceDataFetcher:
                 'shares_outstanding': info.get('sharesOutstanding', 0),
                 'shares_short': info.get('sharesShort', 0),
                 'short_ratio': info.get('shortRatio', 0),
-                'major_holders': major_holders.to_dict() if major_holders is not None else {},
-                'institutional_holders': institutional_holders.to_dict() if institutional_holders is not None else {},
+                # Kept as DataFrames; converted only if a JSON report needs them
+                'major_holders': major_holders,
+                'institutional_holders': institutional_holders,
             }
             
             return shareholding
-        except Exception as e:
-            print(f"Error fetching shareholding pattern: {e}")
+        except Exception:
+            logger.exception("Error fetching shareholding pattern for %s", self.symbol)
             return {}
     
     def get_earnings_history(self) -> pd.DataFrame:
@@ -174,8 +302,9 @@ class YahooFinanceDataFetcher:
         """
         try:
             return self.ticker.earnings_history
-        except Exception as e:
-            print(f"Error fetching earnings history: {e}")
+        except Exception:
+            logger.exception("Error fetching earnings history for %s", self.symbol)
+            import pandas as pd
             return pd.DataFrame()
 
 
@@ -191,10 +320,19 @@ class YouComNewsDataFetcher:
         """
         self.api_key = api_key or Config.YOU_API_KEY
         self.base_url = Config.YOU_API_BASE_URL
-        self.headers = {
-            'X-API-Key': self.api_key,
-            'Content-Type': 'application/json'
-        }
+        self.search_url = f"{self.base_url}{Config.YOU_API_SEARCH_ENDPOINT}"
+        self._enabled = bool(self.api_key)
+        
+        # Without a key no request is ever made, so skip the session setup
+        self.headers = None
+        self.session = None
+        if self._enabled:
+            self.headers = {
+                'X-API-Key': self.api_key,
+                'Content-Type': 'application/json'
+            }
+            self.session = _create_http_session()
+            self.session.headers.update(self.headers)
     
     def search_news(self, query: str, num_results: int = 10) -> List[Dict[str, Any]]:
         """
@@ -207,48 +345,44 @@ class YouComNewsDataFetcher:
         Returns:
             List of news articles
         """
-        if not self.api_key:
-            print("Warning: You.com API key not configured. Returning empty results.")
+        if not self._enabled:
+            logger.warning("You.com API key not configured; returning empty results")
             return []
         
+        import requests
+
         try:
-            endpoint = f"{self.base_url}/search"
             params = {
                 'query': query,
                 'num_web_results': num_results,
             }
             
-            response = requests.get(
-                endpoint,
-                headers=self.headers,
+            response = self.session.get(
+                self.search_url,
                 params=params,
                 timeout=10
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 
-                # Extract news results
-                news_results = []
-                
-                # Check for hits in the response
-                if 'hits' in data:
-                    for hit in data['hits'][:num_results]:
-                        news_results.append({
-                            'title': hit.get('title', ''),
-                            'description': hit.get('description', ''),
-                            'url': hit.get('url', ''),
-                            'published_date': hit.get('published_date', ''),
-                            'source': hit.get('source', ''),
-                        })
-                
-                return news_results
+                # Extract news results from the search hits
+                return [
+                    {
+                        'title': hit.get('title', ''),
+                        'description': hit.get('description', ''),
+                        'url': hit.get('url', ''),
+                        'published_date': hit.get('published_date', ''),
+                        'source': hit.get('source', ''),
+                    }
+                    for hit in data.get('hits', ())[:num_results]
+                ]
             else:
-                print(f"Error fetching news: HTTP {response.status_code}")
+                logger.error("Error fetching news: HTTP %s", response.status_code)
                 return []
                 
-        except Exception as e:
-            print(f"Error searching news: {e}")
+        except (requests.RequestException, ValueError, TypeError, AttributeError):
+            logger.exception("Error searching news for query %r", query)
             return []
     
     def get_stock_news(self, symbol: str, company_name: str = None, 
@@ -289,22 +423,43 @@ class YouComNewsDataFetcher:
             query = f"{symbol} financial analysis earnings report"
         
         return self.search_news(query, num_results=5)
+    
+    def fetch_both(self, symbol: str, 
+                   company_name: str = None) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Get stock news and financial analysis articles concurrently
+        
+        Args:
+            symbol: Stock ticker symbol
+            company_name: Company name (optional)
+            
+        Returns:
+            Tuple of (news articles, financial analysis articles)
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            news = executor.submit(self.get_stock_news, symbol, company_name)
+            analysis = executor.submit(self.get_financial_analysis, symbol, company_name)
+            return news.result(), analysis.result()
 
 
 class DataAggregator:
     """Aggregate data from multiple sources"""
     
-    def __init__(self, symbol: str, you_api_key: str = None):
+    def __init__(self, symbol: str, you_api_key: str = None,
+                 news_fetcher: Optional[YouComNewsDataFetcher] = None):
         """
         Initialize the data aggregator
         
         Args:
             symbol: Stock ticker symbol
             you_api_key: You.com API key
+            news_fetcher: Existing news fetcher to reuse (shares its HTTP
+                session across symbols); overrides you_api_key
         """
         self.symbol = symbol
         self.yahoo_fetcher = YahooFinanceDataFetcher(symbol)
-        self.news_fetcher = YouComNewsDataFetcher(you_api_key)
+        self.news_fetcher = news_fetcher or YouComNewsDataFetcher(you_api_key)
+        self.news_enabled = bool(self.news_fetcher.api_key)
     
     def fetch_all_data(self, period: str = '1y') -> Dict[str, Any]:
         """
@@ -316,27 +471,42 @@ class DataAggregator:
         Returns:
             Dictionary containing all fetched data
         """
-        print(f"Fetching data for {self.symbol}...")
-        
-        # Fetch Yahoo Finance data
-        stock_info = self.yahoo_fetcher.get_stock_info()
-        company_name = stock_info.get('company_name', '')
+        print(f"Fetching Yahoo Finance data for {self.symbol}...")
         
-        data = {
-            'symbol': self.symbol,
-            'fetch_timestamp': datetime.now().isoformat(),
-            'stock_info': stock_info,
-            'historical_data': self.yahoo_fetcher.get_historical_data(period),
-            'financials': self.yahoo_fetcher.get_financials(),
-            'key_ratios': self.yahoo_fetcher.get_key_ratios(),
-            'shareholding': self.yahoo_fetcher.get_shareholding_pattern(),
-            'earnings_history': self.yahoo_fetcher.get_earnings_history(),
-        }
+        # The Yahoo Finance and You.com requests are independent and
+        # network-bound, so run them concurrently instead of back to back
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {
+                'stock_info': executor.submit(self.yahoo_fetcher.get_stock_info),
+                'historical_data': executor.submit(self.yahoo_fetcher.get_historical_data, period),
+                'financials': executor.submit(self.yahoo_fetcher.get_financials),
+                'key_ratios': executor.submit(self.yahoo_fetcher.get_key_ratios),
+                'shareholding': executor.submit(self.yahoo_fetcher.get_shareholding_pattern),
+                'earnings_history': executor.submit(self.yahoo_fetcher.get_earnings_history),
+            }
+            
+            if self.news_enabled:
+                # News queries need the company name, so wait for stock info first
+                stock_info = futures['stock_info'].result()
+                company_name = stock_info.get('company_name', '')
+                
+                print("Fetching news articles...")
+                news_future = executor.submit(
+                    self.news_fetcher.fetch_both, self.symbol, company_name
+                )
+            
+            data = {
+                'symbol': self.symbol,
+                'fetch_timestamp': datetime.now().isoformat(),
+            }
+            data.update({key: future.result() for key, future in futures.items()})
         
-        # Fetch news data
-        print("Fetching news articles...")
-        data['news'] = self.news_fetcher.get_stock_news(self.symbol, company_name)
-        data['financial_analysis'] = self.news_fetcher.get_financial_analysis(self.symbol, company_name)
+        if self.news_enabled:
+            data['news'], data['financial_analysis'] = news_future.result()
+        else:
+            print("Skipping news articles (You.com API key not configured)")
+            data['news'] = []
+            data['financial_analysis'] = []
         
         print(f"Data fetching completed for {self.symbol}")
         return data
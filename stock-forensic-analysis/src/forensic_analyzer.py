@@ -1,17 +1,189 @@
 """
 Forensic analysis module for calculating financial fraud indicators
 """
+import logging
+import operator
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
-from src.utils import safe_divide, calculate_percentage_change
+from src.utils import calculate_percentage_change, njit, prange, safe_divide_array
+
+try:
+    import numexpr as ne
+except ImportError:  # optional: the M-Score series falls back to pandas.eval
+    ne = None
+
+logger = logging.getLogger(__name__)
+
+# Beneish M-Score intercept and weights for DSRI, GMI, AQI, SGI, DEPI, SGAI, LVGI, TATA
+_M_INTERCEPT = -4.84
+_M_WEIGHTS = np.array([0.920, 0.528, 0.404, 0.892, 0.115, -0.172, -0.327, 4.679])
+
+# Altman Z-Score weights for the 5 ratios
+_Z_WEIGHTS = np.array([1.2, 1.4, 3.3, 0.6, 1.0])
+
+# Result keys for the M-Score and Z-Score component arrays, in kernel order
+_M_COMPONENT_NAMES = ('DSRI', 'GMI', 'AQI', 'SGI', 'DEPI', 'SGAI', 'LVGI', 'TATA')
+_Z_COMPONENT_NAMES = (
+    'Working_Capital_to_Total_Assets',
+    'Retained_Earnings_to_Total_Assets',
+    'EBIT_to_Total_Assets',
+    'Market_Value_to_Total_Liabilities',
+    'Sales_to_Total_Assets',
+)
+
+# Beneish M-Score as a single expression over per-period component arrays,
+# built from the intercept and weights above so both code paths agree
+_M_SCORE_EXPR = f"{_M_INTERCEPT!r} + " + " + ".join(
+    f"({weight!r}) * {name.lower()}"
+    for weight, name in zip(_M_WEIGHTS.tolist(), _M_COMPONENT_NAMES)
+)
+
+
+@njit(cache=True)
+def _beneish_kernel(receivables_current, receivables_previous,
+                    revenue_current, revenue_previous,
+                    cogs_current, cogs_previous,
+                    assets_current, assets_previous,
+                    current_assets_current, current_assets_previous,
+                    ppe_current, ppe_previous,
+                    depreciation_current, depreciation_previous,
+                    sga_current, sga_previous,
+                    liabilities_current, liabilities_previous,
+                    net_income, operating_cf):
+    """
+    Compute the Beneish M-Score from extracted statement values
+    
+    Returns:
+        Tuple of (M-Score, array of DSRI, GMI, AQI, SGI, DEPI, SGAI, LVGI, TATA)
+    """
+    non_current_assets_current = assets_current - current_assets_current - ppe_current
+    non_current_assets_previous = assets_previous - current_assets_previous - ppe_previous
+    total_accruals = net_income - operating_cf
+    
+    # Pass 1: per-year ratios (default 0.0 when the denominator is 0)
+    ratios = safe_divide_array(
+        np.array([
+            receivables_current, receivables_previous,              # receivables / sales
+            revenue_current - cogs_current,                         # gross margin
+            revenue_previous - cogs_previous,
+            non_current_assets_current, non_current_assets_previous,  # asset quality
+            depreciation_current, depreciation_previous,            # depreciation rate
+            sga_current, sga_previous,                              # SG&A / sales
+            liabilities_current, liabilities_previous,              # leverage
+            total_accruals,                                         # accruals / assets
+        ]),
+        np.array([
+            revenue_current, revenue_previous,
+            revenue_current, revenue_previous,
+            assets_current, assets_previous,
+            depreciation_current + ppe_current, depreciation_previous + ppe_previous,
+            revenue_current, revenue_previous,
+            assets_current, assets_previous,
+            assets_current,
+        ]),
+        0.0,
+    )
+    
+    # Pass 2: year-over-year indices (default 1.0 when the denominator is 0)
+    # DSRI, GMI, AQI, SGI, DEPI, SGAI, LVGI
+    indices = safe_divide_array(
+        np.array([ratios[0], ratios[3], ratios[4], revenue_current, ratios[7], ratios[8], ratios[10]]),
+        np.array([ratios[1], ratios[2], ratios[5], revenue_previous, ratios[6], ratios[9], ratios[11]]),
+        1.0,
+    )
+    
+    components = np.append(indices, ratios[12])
+    m_score = _M_INTERCEPT + np.sum(_M_WEIGHTS * components)
+    return m_score, components
+
+
+@njit(cache=True, parallel=True)
+def _beneish_batch_kernel(inputs):
+    """
+    Compute Beneish M-Scores for many companies in parallel
+    
+    Args:
+        inputs: Array of shape (N, 20), one row of _beneish_kernel arguments per company
+        
+    Returns:
+        Tuple of (M-Scores of shape (N,), components of shape (N, 8))
+    """
+    n = inputs.shape[0]
+    m_scores = np.empty(n)
+    components = np.empty((n, 8))
+    for i in prange(n):
+        row = inputs[i]
+        m_scores[i], components[i] = _beneish_kernel(
+            row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
+            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18], row[19],
+        )
+    return m_scores, components
+
+
+@njit(cache=True)
+def _altman_kernel(current_assets, current_liabilities, total_assets,
+                   total_liabilities, retained_earnings, ebit, revenue, market_cap):
+    """
+    Compute the Altman Z-Score from extracted statement values
+    
+    Returns:
+        Tuple of (Z-Score, array of the 5 Altman ratios)
+    """
+    ratios = safe_divide_array(
+        np.array([current_assets - current_liabilities, retained_earnings, ebit, market_cap, revenue]),
+        np.array([total_assets, total_assets, total_assets, total_liabilities, total_assets]),
+        0.0,
+    )
+    z_score = np.sum(_Z_WEIGHTS * ratios)
+    return z_score, ratios
 
 
 class ForensicAnalyzer:
     """Perform forensic analysis on financial data"""
     
+    # Instances are created per ticker (many at once in score_batch), so
+    # attributes live in fixed slots instead of a per-instance __dict__
+    __slots__ = (
+        'financial_data', 'balance_sheet', 'income_statement', 'cash_flow', 'stock_info',
+        '_bs_vec', '_is_vec', '_cf_vec', '_bs_cols', '_is_cols',
+        '_beneish_m_score_result', '_altman_z_score_result',
+    )
+    
+    # Statement line items used by the scores; each statement is materialized
+    # as one matrix row per item, in this order (missing items stay 0)
+    _REQUIRED_BS = (
+        'Accounts Receivable', 'Total Assets', 'Total Current Assets', 'Net PPE',
+        'Total Liabilities Net Minority Interest', 'Retained Earnings', 'Total Current Liabilities',
+    )
+    _REQUIRED_IS = (
+        'Total Revenue', 'Cost Of Revenue', 'Selling General And Administration', 'Net Income', 'EBIT',
+    )
+    _REQUIRED_CF = ('Depreciation', 'Operating Cash Flow')
+    
+    # Key-ratio red flag rules, evaluated in order:
+    # (ratio key, category, comparison, value format,
+    #  tiers of (threshold, flag, severity, risk weight) from most to least severe)
+    _RED_FLAG_RULES = (
+        ('profit_margin', 'Profitability', operator.lt, '{:.2f}%', (
+            (0, 'Negative profit margin', 'HIGH', 0.2),
+            (5, 'Low profit margin', 'MEDIUM', 0.1),
+        )),
+        ('debt_to_equity', 'Leverage', operator.gt, '{:.2f}', (
+            (2, 'High debt-to-equity ratio', 'HIGH', 0.2),
+            (1, 'Elevated debt-to-equity ratio', 'MEDIUM', 0.1),
+        )),
+        ('current_ratio', 'Liquidity', operator.lt, '{:.2f}', (
+            (1, 'Current ratio below 1 - potential liquidity issues', 'HIGH', 0.2),
+            (1.5, 'Low current ratio', 'MEDIUM', 0.1),
+        )),
+        ('roe', 'Profitability', operator.lt, '{:.2f}%', (
+            (0, 'Negative Return on Equity', 'HIGH', 0.15),
+        )),
+    )
+    
     def __init__(self, financial_data: Dict[str, Any]):
         """
         Initialize the forensic analyzer
@@ -24,6 +196,87 @@ class ForensicAnalyzer:
         self.income_statement = financial_data.get('financials', {}).get('income_statement', pd.DataFrame())
         self.cash_flow = financial_data.get('financials', {}).get('cash_flow', pd.DataFrame())
         self.stock_info = financial_data.get('stock_info', {})
+        
+        # Number of periods per statement (0 when the statement is empty)
+        self._bs_cols, self._is_cols, cf_cols = (
+            0 if df is None or df.empty else df.shape[1]
+            for df in (self.balance_sheet, self.income_statement, self.cash_flow)
+        )
+        
+        # Only the required rows are materialized, zero-padded to a common
+        # width of at least 2 periods so current/previous reads never go out
+        # of bounds
+        width = max(2, self._bs_cols, self._is_cols, cf_cols)
+        self._bs_vec = self._extract_rows(self.balance_sheet, self._REQUIRED_BS, width)
+        self._is_vec = self._extract_rows(self.income_statement, self._REQUIRED_IS, width)
+        self._cf_vec = self._extract_rows(self.cash_flow, self._REQUIRED_CF, width)
+        
+        # Score results, computed on first request
+        self._beneish_m_score_result = None
+        self._altman_z_score_result = None
+    
+    @staticmethod
+    def _extract_rows(df: pd.DataFrame, row_names: Tuple[str, ...], width: int) -> np.ndarray:
+        """
+        Materialize selected rows of a financial statement as a float matrix
+        
+        Args:
+            df: Financial statement (line items as index, periods as columns)
+            row_names: Line items to extract (matched exactly, then case-insensitively)
+            width: Number of columns of the returned matrix
+            
+        Returns:
+            Matrix of shape (len(row_names), width); NaN, non-numeric and
+            missing values are 0
+        """
+        matrix = np.zeros((len(row_names), width))
+        if df is None or df.empty:
+            return matrix
+        
+        exact, lowered = {}, {}
+        for i, idx in enumerate(df.index):
+            label = str(idx)
+            exact.setdefault(label, i)
+            lowered.setdefault(label.lower(), i)
+        
+        targets, positions = [], []
+        for target, name in enumerate(row_names):
+            position = exact.get(name, lowered.get(name.lower()))
+            if position is not None:
+                targets.append(target)
+                positions.append(position)
+        if not positions:
+            return matrix
+        
+        rows = df.iloc[positions]
+        try:
+            values = rows.to_numpy(dtype=np.float64, na_value=0.0)
+        except (TypeError, ValueError):
+            # Mixed/object cells: convert one by one, treating anything
+            # non-numeric as missing
+            values = np.array([[ForensicAnalyzer._to_float(value) for value in row]
+                               for row in rows.itertuples(index=False, name=None)],
+                              dtype=np.float64).reshape(rows.shape)
+        matrix[targets, :values.shape[1]] = values
+        return matrix
+    
+    @staticmethod
+    def _to_float(value: Any) -> float:
+        """
+        Convert a statement cell to float, mapping NaN and non-numeric values to 0
+        
+        Args:
+            value: Cell value
+            
+        Returns:
+            Float value or 0
+        """
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return 0.0
+        # NaN is the only float that is not equal to itself
+        return 0.0 if value != value else value
     
     def calculate_beneish_m_score(self) -> Dict[str, Any]:
         """
@@ -44,157 +297,167 @@ class ForensicAnalyzer:
         Returns:
             Dictionary with M-Score and component variables
         """
-        try:
-            result = {
-                'score': None,
-                'interpretation': '',
-                'risk_level': 'UNKNOWN',
-                'components': {},
-                'calculation_possible': False
-            }
-            
-            # Check if we have enough data
-            if self.balance_sheet.empty or self.income_statement.empty:
-                result['interpretation'] = 'Insufficient financial data for M-Score calculation'
-                return result
-            
-            # Get current and previous year data
-            if len(self.balance_sheet.columns) < 2 or len(self.income_statement.columns) < 2:
-                result['interpretation'] = 'Need at least 2 years of data for M-Score calculation'
-                return result
-            
-            # Extract financial metrics (current year = index 0, previous year = index 1)
-            try:
-                # Receivables
-                receivables_current = self._get_value(self.balance_sheet, 'Accounts Receivable', 0)
-                receivables_previous = self._get_value(self.balance_sheet, 'Accounts Receivable', 1)
-                
-                # Revenue
-                revenue_current = self._get_value(self.income_statement, 'Total Revenue', 0)
-                revenue_previous = self._get_value(self.income_statement, 'Total Revenue', 1)
-                
-                # Cost of Revenue
-                cogs_current = self._get_value(self.income_statement, 'Cost Of Revenue', 0)
-                cogs_previous = self._get_value(self.income_statement, 'Cost Of Revenue', 1)
-                
-                # Total Assets
-                assets_current = self._get_value(self.balance_sheet, 'Total Assets', 0)
-                assets_previous = self._get_value(self.balance_sheet, 'Total Assets', 1)
-                
-                # Current Assets
-                current_assets_current = self._get_value(self.balance_sheet, 'Total Current Assets', 0)
-                current_assets_previous = self._get_value(self.balance_sheet, 'Total Current Assets', 1)
-                
-                # PPE (Property, Plant, Equipment)
-                ppe_current = self._get_value(self.balance_sheet, 'Net PPE', 0)
-                ppe_previous = self._get_value(self.balance_sheet, 'Net PPE', 1)
-                
-                # Depreciation
-                depreciation_current = abs(self._get_value(self.cash_flow, 'Depreciation', 0))
-                depreciation_previous = abs(self._get_value(self.cash_flow, 'Depreciation', 1))
-                
-                # SG&A Expenses
-                sga_current = self._get_value(self.income_statement, 'Selling General And Administration', 0)
-                sga_previous = self._get_value(self.income_statement, 'Selling General And Administration', 1)
-                
-                # Total Liabilities
-                liabilities_current = self._get_value(self.balance_sheet, 'Total Liabilities Net Minority Interest', 0)
-                liabilities_previous = self._get_value(self.balance_sheet, 'Total Liabilities Net Minority Interest', 1)
-                
-                # Net Income
-                net_income = self._get_value(self.income_statement, 'Net Income', 0)
-                
-                # Operating Cash Flow
-                operating_cf = self._get_value(self.cash_flow, 'Operating Cash Flow', 0)
-                
-                # Calculate the 8 variables
-                
-                # 1. DSRI (Days Sales in Receivables Index)
-                receivables_to_sales_current = safe_divide(receivables_current, revenue_current)
-                receivables_to_sales_previous = safe_divide(receivables_previous, revenue_previous)
-                dsri = safe_divide(receivables_to_sales_current, receivables_to_sales_previous, 1.0)
-                
-                # 2. GMI (Gross Margin Index)
-                gross_margin_previous = safe_divide(revenue_previous - cogs_previous, revenue_previous)
-                gross_margin_current = safe_divide(revenue_current - cogs_current, revenue_current)
-                gmi = safe_divide(gross_margin_previous, gross_margin_current, 1.0)
-                
-                # 3. AQI (Asset Quality Index)
-                non_current_assets_current = assets_current - current_assets_current - ppe_current
-                non_current_assets_previous = assets_previous - current_assets_previous - ppe_previous
-                aqi_current = safe_divide(non_current_assets_current, assets_current)
-                aqi_previous = safe_divide(non_current_assets_previous, assets_previous)
-                aqi = safe_divide(aqi_current, aqi_previous, 1.0)
-                
-                # 4. SGI (Sales Growth Index)
-                sgi = safe_divide(revenue_current, revenue_previous, 1.0)
-                
-                # 5. DEPI (Depreciation Index)
-                depr_rate_previous = safe_divide(depreciation_previous, depreciation_previous + ppe_previous)
-                depr_rate_current = safe_divide(depreciation_current, depreciation_current + ppe_current)
-                depi = safe_divide(depr_rate_previous, depr_rate_current, 1.0)
-                
-                # 6. SGAI (SG&A Index)
-                sga_to_sales_current = safe_divide(sga_current, revenue_current)
-                sga_to_sales_previous = safe_divide(sga_previous, revenue_previous)
-                sgai = safe_divide(sga_to_sales_current, sga_to_sales_previous, 1.0)
-                
-                # 7. LVGI (Leverage Index)
-                leverage_current = safe_divide(liabilities_current, assets_current)
-                leverage_previous = safe_divide(liabilities_previous, assets_previous)
-                lvgi = safe_divide(leverage_current, leverage_previous, 1.0)
-                
-                # 8. TATA (Total Accruals to Total Assets)
-                total_accruals = net_income - operating_cf
-                tata = safe_divide(total_accruals, assets_current)
-                
-                # Calculate M-Score using Beneish's formula
-                m_score = (
-                    -4.84 +
-                    0.920 * dsri +
-                    0.528 * gmi +
-                    0.404 * aqi +
-                    0.892 * sgi +
-                    0.115 * depi -
-                    0.172 * sgai +
-                    4.679 * tata -
-                    0.327 * lvgi
-                )
-                
-                result['score'] = round(m_score, 3)
-                result['calculation_possible'] = True
-                result['components'] = {
-                    'DSRI': round(dsri, 3),
-                    'GMI': round(gmi, 3),
-                    'AQI': round(aqi, 3),
-                    'SGI': round(sgi, 3),
-                    'DEPI': round(depi, 3),
-                    'SGAI': round(sgai, 3),
-                    'LVGI': round(lvgi, 3),
-                    'TATA': round(tata, 3)
-                }
-                
-                # Interpret the score
-                if m_score > -2.22:
-                    result['risk_level'] = 'HIGH'
-                    result['interpretation'] = 'M-Score suggests possible earnings manipulation. Score > -2.22 indicates higher likelihood of manipulation.'
-                else:
-                    result['risk_level'] = 'LOW'
-                    result['interpretation'] = 'M-Score suggests lower likelihood of earnings manipulation. Score <= -2.22 indicates company is likely not manipulating earnings.'
-                
-            except Exception as e:
-                result['interpretation'] = f'Error calculating M-Score components: {str(e)}'
-            
+        if self._beneish_m_score_result is None:
+            self._beneish_m_score_result = self._compute_beneish_m_score()
+        return self._beneish_m_score_result
+    
+    def _compute_beneish_m_score(self) -> Dict[str, Any]:
+        """Compute the Beneish M-Score (uncached)"""
+        result = {
+            'score': None,
+            'interpretation': '',
+            'risk_level': 'UNKNOWN',
+            'components': {},
+            'calculation_possible': False
+        }
+        
+        # Check if we have enough data
+        if not self._bs_cols or not self._is_cols:
+            result['interpretation'] = 'Insufficient financial data for M-Score calculation'
             return result
+        
+        # Get current and previous year data
+        if self._bs_cols < 2 or self._is_cols < 2:
+            result['interpretation'] = 'Need at least 2 years of data for M-Score calculation'
+            return result
+        
+        # Extract financial metrics (missing rows read as 0) and calculate the
+        # 8 variables and the M-Score (zero denominators fall back to defaults)
+        m_score, components = _beneish_kernel(*self._beneish_inputs())
+        return self._m_score_result(float(m_score), components)
+    
+    def _beneish_inputs(self) -> Tuple[float, ...]:
+        """
+        Extract the statement values used by the Beneish M-Score
+        
+        Returns:
+            Tuple of the 20 _beneish_kernel arguments
+            (current year = column 0, previous year = column 1)
+        """
+        receivables, assets, current_assets, ppe, liabilities, _, _ = self._bs_vec[:, :2].tolist()
+        revenue, cogs, sga, net_income, _ = self._is_vec[:, :2].tolist()
+        depreciation, operating_cf = self._cf_vec[:, :2].tolist()
+        
+        return (
+            receivables[0], receivables[1],
+            revenue[0], revenue[1],
+            cogs[0], cogs[1],
+            assets[0], assets[1],
+            current_assets[0], current_assets[1],
+            ppe[0], ppe[1],
+            abs(depreciation[0]), abs(depreciation[1]),
+            sga[0], sga[1],
+            liabilities[0], liabilities[1],
+            net_income[0], operating_cf[0],
+        )
+    
+    @staticmethod
+    def _m_score_result(m_score: float, components: np.ndarray) -> Dict[str, Any]:
+        """
+        Build the scored part of an M-Score result
+        
+        Args:
+            m_score: Beneish M-Score
+            components: DSRI, GMI, AQI, SGI, DEPI, SGAI, LVGI, TATA
             
-        except Exception as e:
-            return {
-                'score': None,
-                'interpretation': f'Error calculating M-Score: {str(e)}',
-                'risk_level': 'UNKNOWN',
-                'components': {},
-                'calculation_possible': False
-            }
+        Returns:
+            M-Score result dictionary
+        """
+        # Interpret the score
+        if m_score > -2.22:
+            risk_level = 'HIGH'
+            interpretation = 'M-Score suggests possible earnings manipulation. Score > -2.22 indicates higher likelihood of manipulation.'
+        else:
+            risk_level = 'LOW'
+            interpretation = 'M-Score suggests lower likelihood of earnings manipulation. Score <= -2.22 indicates company is likely not manipulating earnings.'
+        
+        return {
+            'score': round(m_score, 3),
+            'interpretation': interpretation,
+            'risk_level': risk_level,
+            'components': dict(zip(_M_COMPONENT_NAMES, np.round(components, 3).tolist())),
+            'calculation_possible': True
+        }
+    
+    @classmethod
+    def score_batch(cls, financial_data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Calculate Beneish M-Scores for a portfolio of companies
+        
+        All companies with enough data are scored in one parallel compiled
+        pass instead of one kernel call per company.
+        
+        Args:
+            financial_data_list: One financial_data dictionary per company
+            
+        Returns:
+            List of M-Score results (as from calculate_beneish_m_score), in input order
+        """
+        analyzers = [cls(financial_data) for financial_data in financial_data_list]
+        
+        # Companies without 2 years of both statements keep the regular path,
+        # which reports why the score could not be calculated
+        scorable = [analyzer for analyzer in analyzers
+                    if analyzer._bs_cols >= 2 and analyzer._is_cols >= 2]
+        
+        if scorable:
+            inputs = np.array([analyzer._beneish_inputs() for analyzer in scorable], dtype=np.float64)
+            m_scores, components = _beneish_batch_kernel(inputs)
+            for analyzer, m_score, row in zip(scorable, m_scores.tolist(), components):
+                analyzer._beneish_m_score_result = cls._m_score_result(m_score, row)
+        
+        return [analyzer.calculate_beneish_m_score() for analyzer in analyzers]
+    
+    def calculate_beneish_m_score_series(self) -> pd.Series:
+        """
+        Calculate the Beneish M-Score for every consecutive pair of periods
+        
+        Each period is compared with the one after it (statements are ordered
+        newest first), so the first value matches calculate_beneish_m_score.
+        
+        Returns:
+            Series of M-Scores indexed by the current period of each pair
+            (empty when fewer than 2 periods are available)
+        """
+        periods = min(self._bs_cols, self._is_cols)
+        if periods < 2:
+            return pd.Series(dtype=float)
+        
+        receivables, assets, current_assets, ppe, liabilities, _, _ = self._bs_vec[:, :periods]
+        revenue, cogs, sga, net_income, _ = self._is_vec[:, :periods]
+        depreciation, operating_cf = self._cf_vec[:, :periods]
+        depreciation = np.abs(depreciation)
+        non_current_assets = assets - current_assets - ppe
+        
+        # Pass 1: per-period ratios (default 0.0), all in one division
+        receivables_ratio, gross_margin, asset_quality, depreciation_rate, sga_ratio, leverage = safe_divide_array(
+            np.vstack((receivables, revenue - cogs, non_current_assets, depreciation, sga, liabilities)),
+            np.vstack((revenue, revenue, assets, depreciation + ppe, revenue, assets)),
+            0.0,
+        )
+        
+        # Pass 2: current (0..n-2) vs previous (1..n-1) indices (default 1.0)
+        dsri, gmi, aqi, sgi, depi, sgai, lvgi = safe_divide_array(
+            np.vstack((receivables_ratio[:-1], gross_margin[1:], asset_quality[:-1], revenue[:-1],
+                       depreciation_rate[1:], sga_ratio[:-1], leverage[:-1])),
+            np.vstack((receivables_ratio[1:], gross_margin[:-1], asset_quality[1:], revenue[1:],
+                       depreciation_rate[:-1], sga_ratio[1:], leverage[1:])),
+            1.0,
+        )
+        accruals = net_income - operating_cf
+        tata = safe_divide_array(accruals[:-1], assets[:-1], 0.0)
+        
+        components = {
+            'dsri': dsri, 'gmi': gmi, 'aqi': aqi, 'sgi': sgi,
+            'depi': depi, 'sgai': sgai, 'lvgi': lvgi, 'tata': tata,
+        }
+        
+        if ne is not None:
+            scores = ne.evaluate(_M_SCORE_EXPR, local_dict=components)
+        else:
+            scores = pd.eval(_M_SCORE_EXPR, engine='python', local_dict=components)
+        
+        return pd.Series(scores, index=self.income_statement.columns[:periods - 1], name='m_score')
     
     def calculate_altman_z_score(self) -> Dict[str, Any]:
         """
@@ -214,82 +477,54 @@ class ForensicAnalyzer:
         Returns:
             Dictionary with Z-Score and interpretation
         """
-        try:
-            result = {
-                'score': None,
-                'interpretation': '',
-                'risk_level': 'UNKNOWN',
-                'components': {},
-                'calculation_possible': False
-            }
-            
-            if self.balance_sheet.empty or self.income_statement.empty:
-                result['interpretation'] = 'Insufficient financial data for Z-Score calculation'
-                return result
-            
-            # Extract financial metrics
-            try:
-                # Balance Sheet items
-                current_assets = self._get_value(self.balance_sheet, 'Total Current Assets', 0)
-                current_liabilities = self._get_value(self.balance_sheet, 'Total Current Liabilities', 0)
-                total_assets = self._get_value(self.balance_sheet, 'Total Assets', 0)
-                total_liabilities = self._get_value(self.balance_sheet, 'Total Liabilities Net Minority Interest', 0)
-                retained_earnings = self._get_value(self.balance_sheet, 'Retained Earnings', 0)
-                
-                # Income Statement items
-                ebit = self._get_value(self.income_statement, 'EBIT', 0)
-                revenue = self._get_value(self.income_statement, 'Total Revenue', 0)
-                
-                # Market data
-                market_cap = self.stock_info.get('market_cap', 0)
-                
-                # Calculate working capital
-                working_capital = current_assets - current_liabilities
-                
-                # Calculate the 5 ratios
-                x1 = safe_divide(working_capital, total_assets)  # Working Capital / Total Assets
-                x2 = safe_divide(retained_earnings, total_assets)  # Retained Earnings / Total Assets
-                x3 = safe_divide(ebit, total_assets)  # EBIT / Total Assets
-                x4 = safe_divide(market_cap, total_liabilities)  # Market Value of Equity / Total Liabilities
-                x5 = safe_divide(revenue, total_assets)  # Sales / Total Assets
-                
-                # Calculate Z-Score using Altman's formula
-                z_score = 1.2 * x1 + 1.4 * x2 + 3.3 * x3 + 0.6 * x4 + 1.0 * x5
-                
-                result['score'] = round(z_score, 3)
-                result['calculation_possible'] = True
-                result['components'] = {
-                    'Working_Capital_to_Total_Assets': round(x1, 3),
-                    'Retained_Earnings_to_Total_Assets': round(x2, 3),
-                    'EBIT_to_Total_Assets': round(x3, 3),
-                    'Market_Value_to_Total_Liabilities': round(x4, 3),
-                    'Sales_to_Total_Assets': round(x5, 3)
-                }
-                
-                # Interpret the score
-                if z_score > 2.99:
-                    result['risk_level'] = 'LOW'
-                    result['interpretation'] = 'Z-Score indicates Safe Zone. Low probability of bankruptcy.'
-                elif z_score > 1.81:
-                    result['risk_level'] = 'MEDIUM'
-                    result['interpretation'] = 'Z-Score indicates Grey Zone. Moderate risk of financial distress.'
-                else:
-                    result['risk_level'] = 'HIGH'
-                    result['interpretation'] = 'Z-Score indicates Distress Zone. High probability of bankruptcy within 2 years.'
-                
-            except Exception as e:
-                result['interpretation'] = f'Error calculating Z-Score components: {str(e)}'
-            
+        if self._altman_z_score_result is None:
+            self._altman_z_score_result = self._compute_altman_z_score()
+        return self._altman_z_score_result
+    
+    def _compute_altman_z_score(self) -> Dict[str, Any]:
+        """Compute the Altman Z-Score (uncached)"""
+        result = {
+            'score': None,
+            'interpretation': '',
+            'risk_level': 'UNKNOWN',
+            'components': {},
+            'calculation_possible': False
+        }
+        
+        if not self._bs_cols or not self._is_cols:
+            result['interpretation'] = 'Insufficient financial data for Z-Score calculation'
             return result
-            
-        except Exception as e:
-            return {
-                'score': None,
-                'interpretation': f'Error calculating Z-Score: {str(e)}',
-                'risk_level': 'UNKNOWN',
-                'components': {},
-                'calculation_possible': False
-            }
+        
+        # Balance Sheet and Income Statement items (current year)
+        (_, total_assets, current_assets, _, total_liabilities,
+         retained_earnings, current_liabilities) = self._bs_vec[:, 0].tolist()
+        revenue, _, _, _, ebit = self._is_vec[:, 0].tolist()
+        
+        # Market data (missing or non-numeric market cap counts as 0)
+        market_cap = self._to_float(self.stock_info.get('market_cap'))
+        
+        # Calculate the 5 ratios and the Z-Score
+        z_score, ratios = _altman_kernel(
+            current_assets, current_liabilities, total_assets,
+            total_liabilities, retained_earnings, ebit, revenue, market_cap,
+        )
+        z_score = float(z_score)
+        result['score'] = round(z_score, 3)
+        result['calculation_possible'] = True
+        result['components'] = dict(zip(_Z_COMPONENT_NAMES, np.round(ratios, 3).tolist()))
+        
+        # Interpret the score
+        if z_score > 2.99:
+            result['risk_level'] = 'LOW'
+            result['interpretation'] = 'Z-Score indicates Safe Zone. Low probability of bankruptcy.'
+        elif z_score > 1.81:
+            result['risk_level'] = 'MEDIUM'
+            result['interpretation'] = 'Z-Score indicates Grey Zone. Moderate risk of financial distress.'
+        else:
+            result['risk_level'] = 'HIGH'
+            result['interpretation'] = 'Z-Score indicates Distress Zone. High probability of bankruptcy within 2 years.'
+        
+        return result
     
     def analyze_promoter_pledge(self) -> Dict[str, Any]:
         """
@@ -300,8 +535,10 @@ class ForensicAnalyzer:
         """
         shareholding = self.financial_data.get('shareholding', {})
         
-        insider_ownership = shareholding.get('insider_ownership', 0)
-        institutional_ownership = shareholding.get('institutional_ownership', 0)
+        insider_ownership, institutional_ownership, short_ratio = (
+            shareholding.get(key, 0)
+            for key in ('insider_ownership', 'institutional_ownership', 'short_ratio')
+        )
         
         result = {
             'insider_ownership_percent': round(insider_ownership, 2),
@@ -324,7 +561,6 @@ class ForensicAnalyzer:
             result['red_flags'].append('Low institutional ownership (< 10%) - may indicate lack of institutional confidence')
         
         # Check for high short interest
-        short_ratio = shareholding.get('short_ratio', 0)
         if short_ratio > 10:
             result['red_flags'].append(f'High short interest ratio ({short_ratio:.1f}) - significant bearish sentiment')
             result['risk_level'] = 'HIGH'
@@ -346,81 +582,27 @@ class ForensicAnalyzer:
         red_flags = []
         risk_score = 0.0
         
-        # Check key ratios
+        # Check key ratios against the threshold table; the first tier a
+        # ratio breaches decides its flag
         ratios = self.financial_data.get('key_ratios', {})
         
-        # 1. Declining profit margins
-        profit_margin = ratios.get('profit_margin', 0)
-        if profit_margin < 0:
-            red_flags.append({
-                'category': 'Profitability',
-                'flag': 'Negative profit margin',
-                'severity': 'HIGH',
-                'value': f'{profit_margin:.2f}%'
-            })
-            risk_score += 0.2
-        elif profit_margin < 5:
-            red_flags.append({
-                'category': 'Profitability',
-                'flag': 'Low profit margin',
-                'severity': 'MEDIUM',
-                'value': f'{profit_margin:.2f}%'
-            })
-            risk_score += 0.1
-        
-        # 2. High debt-to-equity ratio
-        debt_to_equity = ratios.get('debt_to_equity', 0)
-        if debt_to_equity > 2:
-            red_flags.append({
-                'category': 'Leverage',
-                'flag': 'High debt-to-equity ratio',
-                'severity': 'HIGH',
-                'value': f'{debt_to_equity:.2f}'
-            })
-            risk_score += 0.2
-        elif debt_to_equity > 1:
-            red_flags.append({
-                'category': 'Leverage',
-                'flag': 'Elevated debt-to-equity ratio',
-                'severity': 'MEDIUM',
-                'value': f'{debt_to_equity:.2f}'
-            })
-            risk_score += 0.1
-        
-        # 3. Low current ratio (liquidity concern)
-        current_ratio = ratios.get('current_ratio', 0)
-        if current_ratio < 1:
-            red_flags.append({
-                'category': 'Liquidity',
-                'flag': 'Current ratio below 1 - potential liquidity issues',
-                'severity': 'HIGH',
-                'value': f'{current_ratio:.2f}'
-            })
-            risk_score += 0.2
-        elif current_ratio < 1.5:
-            red_flags.append({
-                'category': 'Liquidity',
-                'flag': 'Low current ratio',
-                'severity': 'MEDIUM',
-                'value': f'{current_ratio:.2f}'
-            })
-            risk_score += 0.1
-        
-        # 4. Negative ROE
-        roe = ratios.get('roe', 0)
-        if roe < 0:
-            red_flags.append({
-                'category': 'Profitability',
-                'flag': 'Negative Return on Equity',
-                'severity': 'HIGH',
-                'value': f'{roe:.2f}%'
-            })
-            risk_score += 0.15
-        
-        # 5. Check for revenue growth
-        if not self.income_statement.empty and len(self.income_statement.columns) >= 2:
-            revenue_current = self._get_value(self.income_statement, 'Total Revenue', 0)
-            revenue_previous = self._get_value(self.income_statement, 'Total Revenue', 1)
+        for ratio_key, category, breaches, value_format, tiers in self._RED_FLAG_RULES:
+            value = ratios.get(ratio_key, 0)
+            for threshold, flag, severity, weight in tiers:
+                if breaches(value, threshold):
+                    red_flags.append({
+                        'category': category,
+                        'flag': flag,
+                        'severity': severity,
+                        'value': value_format.format(value)
+                    })
+                    risk_score += weight
+                    break
+        
+        # Check for revenue growth
+        if self._is_cols >= 2:
+            # Total Revenue is the first required income statement row
+            revenue_current, revenue_previous = self._is_vec[0, :2].tolist()
             revenue_growth = calculate_percentage_change(revenue_current, revenue_previous)
             
             if revenue_growth < -10:
@@ -442,37 +624,6 @@ class ForensicAnalyzer:
             'risk_level': 'HIGH' if risk_score > 0.6 else 'MEDIUM' if risk_score > 0.3 else 'LOW'
         }
     
-    def _get_value(self, df: pd.DataFrame, row_name: str, col_index: int) -> float:
-        """
-        Safely extract value from financial dataframe
-        
-        Args:
-            df: DataFrame to extract from
-            row_name: Row name to look for
-            col_index: Column index
-            
-        Returns:
-            Extracted value or 0
-        """
-        try:
-            if df.empty or col_index >= len(df.columns):
-                return 0.0
-            
-            # Try exact match first
-            if row_name in df.index:
-                value = df.loc[row_name].iloc[col_index]
-                return float(value) if not pd.isna(value) else 0.0
-            
-            # Try case-insensitive match
-            for idx in df.index:
-                if str(idx).lower() == row_name.lower():
-                    value = df.loc[idx].iloc[col_index]
-                    return float(value) if not pd.isna(value) else 0.0
-            
-            return 0.0
-        except Exception:
-            return 0.0
-    
     def generate_forensic_report(self) -> Dict[str, Any]:
         """
         Generate comprehensive forensic analysis report
@@ -480,16 +631,16 @@ class ForensicAnalyzer:
         Returns:
             Dictionary with complete forensic analysis
         """
-        print("Calculating Beneish M-Score...")
+        logger.debug("Calculating Beneish M-Score...")
         m_score = self.calculate_beneish_m_score()
         
-        print("Calculating Altman Z-Score...")
+        logger.debug("Calculating Altman Z-Score...")
         z_score = self.calculate_altman_z_score()
         
-        print("Analyzing promoter pledge...")
+        logger.debug("Analyzing promoter pledge...")
         pledge_analysis = self.analyze_promoter_pledge()
         
-        print("Detecting financial red flags...")
+        logger.debug("Detecting financial red flags...")
         red_flags = self.detect_financial_red_flags()
         
         # Calculate overall risk score
@@ -500,7 +651,7 @@ class ForensicAnalyzer:
             risk_scores.append(1.0 if z_score['risk_level'] == 'HIGH' else 0.5 if z_score['risk_level'] == 'MEDIUM' else 0.2)
         risk_scores.append(red_flags['risk_score'])
         
-        overall_risk_score = np.mean(risk_scores) if risk_scores else 0.5
+        overall_risk_score = sum(risk_scores) / len(risk_scores) if risk_scores else 0.5
         
         return {
             'timestamp': datetime.now().isoformat(),
@@ -2,9 +2,88 @@
 News analysis module for detecting risk signals in news articles
 """
 import re
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 from datetime import datetime
 from collections import Counter
+from heapq import nlargest
+from operator import itemgetter
+
+try:
+    import ahocorasick
+except ImportError:  # optional: keyword scans fall back to a precompiled regex
+    ahocorasick = None
+
+
+def _build_keyword_automaton(keywords: List[str]):
+    """
+    Build an Aho-Corasick automaton matching every keyword in one pass
+    
+    Args:
+        keywords: Keywords to match (each match yields the keyword itself)
+        
+    Returns:
+        Automaton, or None if pyahocorasick is not installed
+    """
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_keyword_pattern(keywords: List[str]) -> Tuple[re.Pattern, Dict[str, List[str]]]:
+    """
+    Build a single regex finding every keyword in one pass over a text
+    
+    The alternation sits in a zero-width lookahead so overlapping keywords
+    are all visited. At each position only the longest keyword matches, so
+    the keywords contained in it are returned alongside for the caller to
+    add back. Keywords are bucketed by first character, so a position whose
+    character starts no keyword is rejected after a single comparison.
+    
+    Args:
+        keywords: Keywords to match
+        
+    Returns:
+        Tuple of (compiled pattern, keyword -> other keywords it contains)
+    """
+    unique = sorted(set(keywords), key=len, reverse=True)
+    
+    # first character -> remaining characters, longest keyword first
+    by_first_char = {}
+    for keyword in unique:
+        by_first_char.setdefault(keyword[0], []).append(keyword[1:])
+    
+    alternatives = (
+        re.escape(first) + '(?:' + '|'.join(map(re.escape, rests)) + ')'
+        for first, rests in by_first_char.items()
+    )
+    pattern = re.compile('(?=(' + '|'.join(alternatives) + '))')
+    contained = {
+        keyword: [other for other in unique if other != keyword and other in keyword]
+        for keyword in unique
+    }
+    return pattern, contained
+
+
+# Candidate topic words, and common stop words excluded from topics
+_TOPIC_WORD_RE = re.compile(r'\b[a-z]{4,}\b')
+_TOPIC_STOP_WORDS = frozenset({
+    'that', 'this', 'with', 'from', 'have', 'been', 'will', 'their',
+    'about', 'which', 'were', 'said', 'what', 'when', 'where', 'more',
+    'than', 'other', 'some', 'into', 'could', 'would', 'should', 'also'
+})
+
+# Vocabulary size above which words seen only once are dropped from the
+# cached topic counts (they can only rank once every repeated word has)
+_TOPIC_PRUNE_SIZE = 10000
+
+# Below this many articles topic words are tallied in a plain dict, whose
+# setup is cheaper than a Counter's for such small inputs
+_TOPIC_DICT_TALLY_MAX = 20
 
 
 class NewsAnalyzer:
@@ -36,6 +115,27 @@ class NewsAnalyzer:
         'acquisition', 'partnership', 'award', 'leadership', 'momentum'
     ]
     
+    # Keyword sets for constant-time membership, paired with their lists
+    # (which fix the order keywords are reported in)
+    HIGH_RISK_SET = frozenset(HIGH_RISK_KEYWORDS)
+    MEDIUM_RISK_SET = frozenset(MEDIUM_RISK_KEYWORDS)
+    LOW_RISK_SET = frozenset(LOW_RISK_KEYWORDS)
+    POSITIVE_SET = frozenset(POSITIVE_KEYWORDS)
+    _KEYWORD_BUCKETS = (
+        (HIGH_RISK_KEYWORDS, HIGH_RISK_SET),
+        (MEDIUM_RISK_KEYWORDS, MEDIUM_RISK_SET),
+        (LOW_RISK_KEYWORDS, LOW_RISK_SET),
+        (POSITIVE_KEYWORDS, POSITIVE_SET),
+    )
+    
+    # Single automaton (or regex fallback) over all keyword lists, built once at import
+    _KEYWORD_AUTOMATON = _build_keyword_automaton(
+        HIGH_RISK_KEYWORDS + MEDIUM_RISK_KEYWORDS + LOW_RISK_KEYWORDS + POSITIVE_KEYWORDS
+    )
+    _KEYWORD_PATTERN, _KEYWORD_CONTAINED = _build_keyword_pattern(
+        HIGH_RISK_KEYWORDS + MEDIUM_RISK_KEYWORDS + LOW_RISK_KEYWORDS + POSITIVE_KEYWORDS
+    )
+    
     def __init__(self, news_data: List[Dict[str, Any]]):
         """
         Initialize the news analyzer
@@ -44,6 +144,58 @@ class NewsAnalyzer:
             news_data: List of news articles
         """
         self.news_data = news_data
+        
+        # (title, description, lower-cased "title description") per article,
+        # built once and shared by every keyword scan
+        self._texts = []
+        for article in news_data or ():
+            title = article.get('title', '')
+            description = article.get('description', '')
+            self._texts.append((title, description, f"{title} {description}".lower()))
+        
+        # Keyword hits per article and sub-report results, computed on first use
+        self._keyword_hits = None
+        self._sentiment_result = None
+        self._risk_signals_result = None
+        self._high_risk_rows = None
+        self._topic_counts = None
+        self._topic_counts_pruned = False
+    
+    def _scan_all(self) -> List[Tuple[List[str], List[str], List[str], List[str]]]:
+        """
+        Keyword hits for every article, scanned once per analyzer
+        
+        Returns:
+            One _match_keywords result per article, in article order
+        """
+        if self._keyword_hits is None:
+            self._keyword_hits = [self._match_keywords(text) for _, _, text in self._texts]
+        return self._keyword_hits
+    
+    def _match_keywords(self, text: str) -> Tuple[List[str], List[str], List[str], List[str]]:
+        """
+        Find the high-risk, medium-risk, low-risk and positive keywords in a text
+        
+        Args:
+            text: Lower-cased article text
+            
+        Returns:
+            Tuple of keyword lists (high, medium, low, positive), each in
+            keyword-list order with every keyword at most once
+        """
+        if self._KEYWORD_AUTOMATON is not None:
+            found = {keyword for _, keyword in self._KEYWORD_AUTOMATON.iter(text)}
+        else:
+            found = set(self._KEYWORD_PATTERN.findall(text))
+            for keyword in list(found):
+                found.update(self._KEYWORD_CONTAINED[keyword])
+        
+        if not found:
+            return [], [], [], []
+        
+        # Only the (few) hits are bucketed, instead of walking every keyword list
+        return tuple(sorted(found & keyword_set, key=keywords.index)
+                     for keywords, keyword_set in self._KEYWORD_BUCKETS)
     
     def analyze_sentiment(self) -> Dict[str, Any]:
         """
@@ -52,6 +204,12 @@ class NewsAnalyzer:
         Returns:
             Dictionary with sentiment analysis
         """
+        if self._sentiment_result is None:
+            self._sentiment_result = self._compute_sentiment()
+        return self._sentiment_result
+    
+    def _compute_sentiment(self) -> Dict[str, Any]:
+        """Compute the sentiment analysis (uncached)"""
         if not self.news_data:
             return {
                 'sentiment_score': 0.0,
@@ -66,14 +224,9 @@ class NewsAnalyzer:
         negative_count = 0
         neutral_count = 0
         
-        for article in self.news_data:
-            text = f"{article.get('title', '')} {article.get('description', '')}".lower()
-            
+        for hits in self._scan_all():
             # Count keyword matches
-            high_risk_matches = sum(1 for keyword in self.HIGH_RISK_KEYWORDS if keyword in text)
-            medium_risk_matches = sum(1 for keyword in self.MEDIUM_RISK_KEYWORDS if keyword in text)
-            low_risk_matches = sum(1 for keyword in self.LOW_RISK_KEYWORDS if keyword in text)
-            positive_matches = sum(1 for keyword in self.POSITIVE_KEYWORDS if keyword in text)
+            high_risk_matches, medium_risk_matches, low_risk_matches, positive_matches = map(len, hits)
             
             # Calculate article sentiment
             negative_score = high_risk_matches * 3 + medium_risk_matches * 2 + low_risk_matches
@@ -115,6 +268,14 @@ class NewsAnalyzer:
         Returns:
             Dictionary with detected risk signals
         """
+        if self._risk_signals_result is None:
+            self._risk_signals_result = self._compute_risk_signals()
+        return self._risk_signals_result
+    
+    def _compute_risk_signals(self) -> Dict[str, Any]:
+        """Compute the risk signals (uncached)"""
+        # Article index behind each 'high_risk' entry, for get_critical_news
+        self._high_risk_rows = []
         risk_signals = {
             'high_risk': [],
             'medium_risk': [],
@@ -130,19 +291,12 @@ class NewsAnalyzer:
         medium_risk_count = 0
         low_risk_count = 0
         
-        for article in self.news_data:
-            title = article.get('title', '')
-            description = article.get('description', '')
-            text = f"{title} {description}".lower()
+        for row, (article, (title, _, _), hits) in enumerate(zip(self.news_data, self._texts, self._scan_all())):
             url = article.get('url', '')
             published_date = article.get('published_date', '')
+            high_risk_found, medium_risk_found, low_risk_found, _ = hits
             
             # Check for high-risk keywords
-            high_risk_found = []
-            for keyword in self.HIGH_RISK_KEYWORDS:
-                if keyword in text:
-                    high_risk_found.append(keyword)
-            
             if high_risk_found:
                 risk_signals['high_risk'].append({
                     'title': title,
@@ -151,13 +305,9 @@ class NewsAnalyzer:
                     'date': published_date
                 })
                 high_risk_count += len(high_risk_found)
+                self._high_risk_rows.append(row)
             
             # Check for medium-risk keywords
-            medium_risk_found = []
-            for keyword in self.MEDIUM_RISK_KEYWORDS:
-                if keyword in text:
-                    medium_risk_found.append(keyword)
-            
             if medium_risk_found and not high_risk_found:
                 risk_signals['medium_risk'].append({
                     'title': title,
@@ -168,11 +318,6 @@ class NewsAnalyzer:
                 medium_risk_count += len(medium_risk_found)
             
             # Check for low-risk keywords
-            low_risk_found = []
-            for keyword in self.LOW_RISK_KEYWORDS:
-                if keyword in text:
-                    low_risk_found.append(keyword)
-            
             if low_risk_found and not high_risk_found and not medium_risk_found:
                 risk_signals['low_risk'].append({
                     'title': title,
@@ -215,32 +360,36 @@ class NewsAnalyzer:
         if not self.news_data:
             return []
         
-        # Combine all text
-        all_text = ' '.join([
-            f"{article.get('title', '')} {article.get('description', '')}"
-            for article in self.news_data
-        ]).lower()
-        
-        # Remove common words and extract meaningful terms
-        words = re.findall(r'\b[a-z]{4,}\b', all_text)
-        
-        # Common stop words to exclude
-        stop_words = {
-            'that', 'this', 'with', 'from', 'have', 'been', 'will', 'their',
-            'about', 'which', 'were', 'said', 'what', 'when', 'where', 'more',
-            'than', 'other', 'some', 'into', 'could', 'would', 'should', 'also'
-        }
-        
-        # Filter out stop words
-        filtered_words = [word for word in words if word not in stop_words]
-        
-        # Count word frequency
-        word_counts = Counter(filtered_words)
+        # Count meaningful terms article by article, skipping stop words
+        # (counted once; later calls only re-rank). Counts pruned of single
+        # occurrences are recounted in full if they cannot fill top_n.
+        if self._topic_counts is None or (self._topic_counts_pruned and top_n > len(self._topic_counts)):
+            if len(self.news_data) < _TOPIC_DICT_TALLY_MAX:
+                word_counts = {}
+                for _, _, text in self._texts:
+                    for word in _TOPIC_WORD_RE.findall(text):
+                        if word not in _TOPIC_STOP_WORDS:
+                            word_counts[word] = word_counts.get(word, 0) + 1
+            else:
+                word_counts = Counter()
+                for _, _, text in self._texts:
+                    word_counts.update(
+                        word for word in _TOPIC_WORD_RE.findall(text) if word not in _TOPIC_STOP_WORDS
+                    )
+            
+            self._topic_counts_pruned = False
+            if len(word_counts) > _TOPIC_PRUNE_SIZE and self._topic_counts is None:
+                repeated = {word: count for word, count in word_counts.items() if count > 1}
+                if len(repeated) >= top_n:
+                    word_counts = repeated
+                    self._topic_counts_pruned = True
+            self._topic_counts = word_counts
+        word_counts = self._topic_counts
         
-        # Get top topics
+        # Get top topics with a heap bounded by top_n (ties keep first-seen order)
         top_topics = [
             {'topic': word, 'frequency': count}
-            for word, count in word_counts.most_common(top_n)
+            for word, count in nlargest(top_n, word_counts.items(), key=itemgetter(1))
         ]
         
         return top_topics
@@ -282,25 +431,18 @@ class NewsAnalyzer:
         Returns:
             List of critical news articles
         """
-        critical_news = []
+        # Critical articles are exactly the high-risk signals; reuse that scan
+        # and join each entry back to its article for the description
+        high_risk = self.detect_risk_signals()['high_risk']
         
-        for article in self.news_data:
-            text = f"{article.get('title', '')} {article.get('description', '')}".lower()
-            
-            # Check for high-risk keywords
-            critical_keywords = []
-            for keyword in self.HIGH_RISK_KEYWORDS:
-                if keyword in text:
-                    critical_keywords.append(keyword)
-            
-            if critical_keywords:
-                critical_news.append({
-                    'title': article.get('title', ''),
-                    'description': article.get('description', ''),
-                    'url': article.get('url', ''),
-                    'published_date': article.get('published_date', ''),
-                    'critical_keywords': critical_keywords,
-                    'severity': 'HIGH'
-                })
-        
-        return critical_news
+        return [
+            {
+                'title': signal['title'],
+                'description': self._texts[row][1],
+                'url': signal['url'],
+                'published_date': signal['date'],
+                'critical_keywords': signal['keywords'],
+                'severity': 'HIGH'
+            }
+            for signal, row in zip(high_risk, self._high_risk_rows)
+        ]
@@ -6,12 +6,180 @@ import numpy as np
 from typing import Dict, List, Any, Tuple
 from datetime import datetime, timedelta
 
-from src.utils import calculate_moving_average, detect_outliers
+from src.utils import HAS_NUMBA, detect_outliers, njit
+
+
+@njit(cache=True)
+def _price_anomaly_kernel(close, window):
+    """
+    Find closes outside the 2-standard-deviation band around their moving average
+    
+    A single Welford pass keeps the rolling mean and sample standard deviation
+    of the last `window` closes up to date (NaN closes are skipped); a close is
+    only tested once the window holds `window` valid observations.
+    
+    Args:
+        close: Closing prices
+        window: Rolling window size
+        
+    Returns:
+        Tuple of (positions of anomalous closes, moving average at those positions)
+    """
+    n = close.shape[0]
+    positions = np.empty(n, dtype=np.int64)
+    averages = np.empty(n)
+    count = 0
+    
+    nobs = 0
+    mean = 0.0
+    ssqdm = 0.0  # sum of squared deviations from the mean
+    for i in range(n):
+        value = close[i]
+        if not np.isnan(value):
+            nobs += 1
+            delta = value - mean
+            mean += delta / nobs
+            ssqdm += delta * (value - mean)
+        
+        if i >= window:
+            old = close[i - window]
+            if not np.isnan(old):
+                nobs -= 1
+                if nobs == 0:
+                    mean = 0.0
+                    ssqdm = 0.0
+                else:
+                    delta = old - mean
+                    mean -= delta / nobs
+                    ssqdm -= delta * (old - mean)
+        
+        if nobs >= window and nobs > 1 and not np.isnan(value):
+            band = 2.0 * np.sqrt(max(ssqdm / (nobs - 1), 0.0))
+            if value > mean + band or value < mean - band:
+                positions[count] = i
+                averages[count] = mean
+                count += 1
+    
+    return positions[:count], averages[:count]
+
+
+def _format_dates(index: pd.DatetimeIndex, positions: np.ndarray) -> List[str]:
+    """
+    Format selected index dates as YYYY-MM-DD in one vectorized call
+    
+    Args:
+        index: DatetimeIndex of the price data (timezone-aware or naive)
+        positions: Positions of the dates to format
+        
+    Returns:
+        List of date strings
+    """
+    if index.tz is not None:
+        # Keep the exchange-local calendar date rather than the UTC one
+        index = index.tz_localize(None)
+    return np.datetime_as_string(index.values[positions], unit='D').tolist()
+
+
+def _nanmean(values: np.ndarray) -> float:
+    """
+    Mean of the non-NaN values (NaN if there are none)
+    
+    Args:
+        values: Input array
+        
+    Returns:
+        Mean value
+    """
+    valid = values[~np.isnan(values)]
+    return valid.sum() / len(valid) if len(valid) else np.nan
+
+
+def _price_anomalies_prefix_sums(close: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized equivalent of _price_anomaly_kernel for when numba is missing
+    
+    Rolling sums of x and x² come from two prefix sums, so mean and standard
+    deviation for every window take one pass instead of a Python-level loop.
+    Prices are shifted by their mean first to limit cancellation in the x² sums.
+    
+    Args:
+        close: Closing prices
+        window: Rolling window size
+        
+    Returns:
+        Tuple of (positions of anomalous closes, moving average at those positions)
+    """
+    valid = ~np.isnan(close)
+    shift = close[valid].mean() if valid.any() else 0.0
+    shifted = np.where(valid, close - shift, 0.0)
+    
+    # Window start for every position (partial windows at the beginning)
+    starts = np.maximum(np.arange(1, len(close) + 1) - window, 0)
+    
+    def window_sums(values):
+        prefix = np.concatenate(([0.0], np.cumsum(values)))
+        return prefix[1:] - prefix[starts]
+    
+    nobs = window_sums(valid.astype(np.float64))
+    sums = window_sums(shifted)
+    squares = window_sums(shifted * shifted)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = sums / nobs
+        band = 2.0 * np.sqrt(np.maximum((squares - sums * mean) / (nobs - 1), 0.0))
+    
+    deviation = shifted - mean
+    anomalous = valid & (nobs >= window) & (nobs > 1) & ((deviation > band) | (deviation < -band))
+    positions = np.flatnonzero(anomalous)
+    return positions, mean[positions] + shift
+
+
+@njit(cache=True)
+def _sample_std(values):
+    """Sample standard deviation (ddof=1); NaN for fewer than 2 values"""
+    n = values.shape[0]
+    if n < 2:
+        return np.nan
+    mean = values.sum() / n
+    return np.sqrt(((values - mean) ** 2).sum() / (n - 1))
+
+
+@njit(cache=True)
+def _volatility_kernel(returns, recent_days):
+    """
+    Compute volatility statistics of daily returns
+    
+    Args:
+        returns: Daily returns (no NaN)
+        recent_days: Number of trailing returns used for recent volatility
+        
+    Returns:
+        Tuple of (annualized volatility %, recent annualized volatility %,
+        max daily return, min daily return); NaN where undefined
+    """
+    n = returns.shape[0]
+    if n == 0:
+        return np.nan, np.nan, np.nan, np.nan
+    
+    annualize = np.sqrt(252.0) * 100
+    volatility = _sample_std(returns) * annualize
+    recent_volatility = _sample_std(returns[max(n - recent_days, 0):]) * annualize
+    return volatility, recent_volatility, returns.max(), returns.min()
 
 
 class PatternDetector:
     """Detect unusual patterns in stock price and volume data"""
     
+    # Risk score per risk level for the volume spike, price anomaly, gap,
+    # divergence and volatility reports (in that order); other levels score 0.2
+    _RISK_LEVEL_SCORES = (
+        {'HIGH': 0.8, 'MEDIUM': 0.5},
+        {'HIGH': 0.7, 'MEDIUM': 0.4},
+        {'HIGH': 0.6, 'MEDIUM': 0.4},
+        {'MEDIUM': 0.5},
+        {'HIGH': 0.7, 'MEDIUM': 0.4},
+    )
+    
     def __init__(self, historical_data: pd.DataFrame):
         """
         Initialize the pattern detector
@@ -21,6 +189,13 @@ class PatternDetector:
         """
         self.data = historical_data
         self.has_data = not historical_data.empty
+        
+        # Price/volume columns as float arrays (None when missing), extracted
+        # once and shared by every detector
+        columns = historical_data.columns
+        self._open = historical_data['Open'].to_numpy(dtype=np.float64) if 'Open' in columns else None
+        self._close = historical_data['Close'].to_numpy(dtype=np.float64) if 'Close' in columns else None
+        self._volume = historical_data['Volume'].to_numpy(dtype=np.float64) if 'Volume' in columns else None
     
     def detect_volume_spikes(self, threshold: float = 2.0) -> Dict[str, Any]:
         """
@@ -32,7 +207,7 @@ class PatternDetector:
         Returns:
             Dictionary with volume spike analysis
         """
-        if not self.has_data or 'Volume' not in self.data.columns:
+        if not self.has_data or self._volume is None:
             return {
                 'spikes_detected': 0,
                 'spike_dates': [],
@@ -40,37 +215,44 @@ class PatternDetector:
                 'risk_level': 'UNKNOWN'
             }
         
-        # Calculate average volume
-        avg_volume = self.data['Volume'].mean()
+        # Calculate average volume (ignoring missing volumes)
+        volume = self._volume
+        avg_volume = _nanmean(volume)
+        
+        # Detect spikes with a boolean mask over the raw arrays
+        spike_positions = np.flatnonzero(volume > avg_volume * threshold)
+        multipliers = np.round(volume[spike_positions] / avg_volume, 2)
         
-        # Detect spikes
-        volume_spikes = self.data[self.data['Volume'] > avg_volume * threshold]
+        # Rank by multiplier (highest first; stable, so ties keep date order)
+        # and only build entries for the top 10
+        top = np.argsort(-multipliers, kind='stable')[:10]
+        close = self._close
+        dates = _format_dates(self.data.index, spike_positions[top])
         
         spike_dates = []
-        for date, row in volume_spikes.iterrows():
+        for i, date in zip(top, dates):
+            position = spike_positions[i]
             spike_dates.append({
-                'date': date.strftime('%Y-%m-%d'),
-                'volume': int(row['Volume']),
-                'multiplier': round(row['Volume'] / avg_volume, 2),
-                'close_price': round(row['Close'], 2)
+                'date': date,
+                'volume': int(volume[position]),
+                'multiplier': multipliers[i],
+                'close_price': round(close[position], 2)
             })
-        
-        # Sort by multiplier (highest first)
-        spike_dates.sort(key=lambda x: x['multiplier'], reverse=True)
+        spikes_detected = len(spike_positions)
         
         # Determine risk level
         risk_level = 'LOW'
-        if len(spike_dates) > 10:
+        if spikes_detected > 10:
             risk_level = 'HIGH'
-        elif len(spike_dates) > 5:
+        elif spikes_detected > 5:
             risk_level = 'MEDIUM'
         
         return {
-            'spikes_detected': len(spike_dates),
-            'spike_dates': spike_dates[:10],  # Return top 10
+            'spikes_detected': spikes_detected,
+            'spike_dates': spike_dates,  # Top 10
             'average_volume': int(avg_volume),
             'risk_level': risk_level,
-            'interpretation': f'Detected {len(spike_dates)} volume spikes above {threshold}x average volume'
+            'interpretation': f'Detected {spikes_detected} volume spikes above {threshold}x average volume'
         }
     
     def detect_price_anomalies(self, window: int = 20) -> Dict[str, Any]:
@@ -83,55 +265,53 @@ class PatternDetector:
         Returns:
             Dictionary with price anomaly analysis
         """
-        if not self.has_data or 'Close' not in self.data.columns:
+        if not self.has_data or self._close is None:
             return {
                 'anomalies_detected': 0,
                 'anomaly_dates': [],
                 'risk_level': 'UNKNOWN'
             }
         
-        # Calculate moving average and standard deviation
-        ma = calculate_moving_average(self.data['Close'], window)
-        std = self.data['Close'].rolling(window=window).std()
+        # Detect anomalies (price deviates more than 2 standard deviations
+        # from its moving average) in one compiled pass
+        close = self._close
+        if HAS_NUMBA:
+            anomaly_positions, averages = _price_anomaly_kernel(close, window)
+        else:
+            anomaly_positions, averages = _price_anomalies_prefix_sums(close, window)
+        prices = close[anomaly_positions]
+        deviations = np.round(((prices - averages) / averages) * 100, 2)
         
-        # Detect anomalies (price deviates more than 2 standard deviations)
-        upper_band = ma + (2 * std)
-        lower_band = ma - (2 * std)
-        
-        anomalies = self.data[
-            (self.data['Close'] > upper_band) | 
-            (self.data['Close'] < lower_band)
-        ]
+        # Rank by absolute deviation (stable, so ties keep date order) and
+        # only build entries for the top 10
+        top = np.argsort(-np.abs(deviations), kind='stable')[:10]
+        dates = _format_dates(self.data.index, anomaly_positions[top])
         
         anomaly_dates = []
-        for date, row in anomalies.iterrows():
-            price = row['Close']
-            ma_value = ma.loc[date]
-            deviation = ((price - ma_value) / ma_value) * 100
-            
+        for i, date in zip(top, dates):
+            price = prices[i]
+            ma_value = averages[i]
             anomaly_dates.append({
-                'date': date.strftime('%Y-%m-%d'),
+                'date': date,
                 'price': round(price, 2),
                 'moving_average': round(ma_value, 2),
-                'deviation_percent': round(deviation, 2),
+                'deviation_percent': deviations[i],
                 'type': 'SPIKE' if price > ma_value else 'DROP'
             })
-        
-        # Sort by absolute deviation
-        anomaly_dates.sort(key=lambda x: abs(x['deviation_percent']), reverse=True)
+        anomalies_detected = len(anomaly_positions)
         
         # Determine risk level
         risk_level = 'LOW'
-        if len(anomaly_dates) > 15:
+        if anomalies_detected > 15:
             risk_level = 'HIGH'
-        elif len(anomaly_dates) > 8:
+        elif anomalies_detected > 8:
             risk_level = 'MEDIUM'
         
         return {
-            'anomalies_detected': len(anomaly_dates),
-            'anomaly_dates': anomaly_dates[:10],  # Return top 10
+            'anomalies_detected': anomalies_detected,
+            'anomaly_dates': anomaly_dates,  # Top 10
             'risk_level': risk_level,
-            'interpretation': f'Detected {len(anomaly_dates)} price anomalies beyond 2 standard deviations'
+            'interpretation': f'Detected {anomalies_detected} price anomalies beyond 2 standard deviations'
         }
     
     def detect_gap_movements(self, gap_threshold: float = 5.0) -> Dict[str, Any]:
@@ -144,38 +324,47 @@ class PatternDetector:
         Returns:
             Dictionary with gap movement analysis
         """
-        if not self.has_data or 'Open' not in self.data.columns or 'Close' not in self.data.columns:
+        if not self.has_data or self._open is None or self._close is None:
             return {
                 'gaps_detected': 0,
                 'gap_dates': [],
                 'risk_level': 'UNKNOWN'
             }
         
-        # Calculate gap percentage
-        prev_close = self.data['Close'].shift(1)
-        gap_percent = ((self.data['Open'] - prev_close) / prev_close) * 100
+        # Calculate gap percentage against the previous close (none for the first day)
+        open_prices = self._open
+        close = self._close
+        prev_closes = np.empty_like(close)
+        prev_closes[0] = np.nan
+        prev_closes[1:] = close[:-1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            gap_percent = ((open_prices - prev_closes) / prev_closes) * 100
         
         # Detect significant gaps
-        significant_gaps = self.data[abs(gap_percent) > gap_threshold]
+        gap_positions = np.flatnonzero(np.abs(gap_percent) > gap_threshold)
+        gaps = gap_percent[gap_positions]
+        rounded_gaps = np.round(gaps, 2)
+        
+        # Rank by absolute gap percentage (stable, so ties keep date order)
+        # and only build entries for the top 10
+        top = np.argsort(-np.abs(rounded_gaps), kind='stable')[:10]
+        dates = _format_dates(self.data.index, gap_positions[top])
         
         gap_dates = []
-        for date, row in significant_gaps.iterrows():
-            gap_pct = gap_percent.loc[date]
-            
+        for i, date in zip(top, dates):
+            position = gap_positions[i]
             gap_dates.append({
-                'date': date.strftime('%Y-%m-%d'),
-                'gap_percent': round(gap_pct, 2),
-                'open_price': round(row['Open'], 2),
-                'previous_close': round(prev_close.loc[date], 2),
-                'type': 'GAP_UP' if gap_pct > 0 else 'GAP_DOWN'
+                'date': date,
+                'gap_percent': rounded_gaps[i],
+                'open_price': round(open_prices[position], 2),
+                'previous_close': round(prev_closes[position], 2),
+                'type': 'GAP_UP' if gaps[i] > 0 else 'GAP_DOWN'
             })
         
-        # Sort by absolute gap percentage
-        gap_dates.sort(key=lambda x: abs(x['gap_percent']), reverse=True)
-        
         # Determine risk level
         risk_level = 'LOW'
-        gap_down_count = sum(1 for g in gap_dates if g['type'] == 'GAP_DOWN')
+        gap_up_count = int(np.count_nonzero(gaps > 0))
+        gap_down_count = len(gaps) - gap_up_count
         
         if gap_down_count > 5:
             risk_level = 'HIGH'
@@ -183,12 +372,12 @@ class PatternDetector:
             risk_level = 'MEDIUM'
         
         return {
-            'gaps_detected': len(gap_dates),
-            'gap_dates': gap_dates[:10],  # Return top 10
-            'gap_up_count': sum(1 for g in gap_dates if g['type'] == 'GAP_UP'),
+            'gaps_detected': len(gaps),
+            'gap_dates': gap_dates,  # Top 10
+            'gap_up_count': gap_up_count,
             'gap_down_count': gap_down_count,
             'risk_level': risk_level,
-            'interpretation': f'Detected {len(gap_dates)} significant gaps (>{gap_threshold}%)'
+            'interpretation': f'Detected {len(gaps)} significant gaps (>{gap_threshold}%)'
         }
     
     def detect_price_volume_divergence(self) -> Dict[str, Any]:
@@ -198,7 +387,7 @@ class PatternDetector:
         Returns:
             Dictionary with divergence analysis
         """
-        if not self.has_data or 'Close' not in self.data.columns or 'Volume' not in self.data.columns:
+        if not self.has_data or self._close is None or self._volume is None:
             return {
                 'divergence_detected': False,
                 'risk_level': 'UNKNOWN',
@@ -206,9 +395,10 @@ class PatternDetector:
             }
         
         # Calculate recent trends (last 20 days)
-        recent_data = self.data.tail(20)
+        close = self._close[-20:]
+        volume = self._volume[-20:]
         
-        if len(recent_data) < 10:
+        if len(close) < 10:
             return {
                 'divergence_detected': False,
                 'risk_level': 'UNKNOWN',
@@ -216,13 +406,13 @@ class PatternDetector:
             }
         
         # Calculate price trend
-        price_start = recent_data['Close'].iloc[0]
-        price_end = recent_data['Close'].iloc[-1]
+        price_start = close[0]
+        price_end = close[-1]
         price_trend = ((price_end - price_start) / price_start) * 100
         
-        # Calculate volume trend
-        volume_ma_start = recent_data['Volume'].iloc[:5].mean()
-        volume_ma_end = recent_data['Volume'].iloc[-5:].mean()
+        # Calculate volume trend (first vs last 5 days, ignoring missing volumes)
+        volume_ma_start = _nanmean(volume[:5])
+        volume_ma_end = _nanmean(volume[-5:])
         volume_trend = ((volume_ma_end - volume_ma_start) / volume_ma_start) * 100
         
         # Detect divergence
@@ -265,21 +455,21 @@ class PatternDetector:
         Returns:
             Dictionary with volatility analysis
         """
-        if not self.has_data or 'Close' not in self.data.columns:
+        if not self.has_data or self._close is None:
             return {
                 'volatility': 0,
                 'risk_level': 'UNKNOWN'
             }
         
-        # Calculate daily returns
-        returns = self.data['Close'].pct_change().dropna()
+        # Calculate daily returns (dropping those involving a missing close)
+        close = self._close
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns = close[1:] / close[:-1] - 1
+        returns = returns[~np.isnan(returns)]
         
-        # Calculate volatility (standard deviation of returns)
-        volatility = returns.std() * np.sqrt(252) * 100  # Annualized
-        
-        # Calculate recent volatility (last 30 days)
-        recent_returns = returns.tail(30)
-        recent_volatility = recent_returns.std() * np.sqrt(252) * 100
+        # Annualized volatility (standard deviation of returns), overall and
+        # for the last 30 days, plus the daily extremes
+        volatility, recent_volatility, max_return, min_return = _volatility_kernel(returns, 30)
         
         # Determine risk level
         risk_level = 'LOW'
@@ -291,8 +481,8 @@ class PatternDetector:
         return {
             'annualized_volatility': round(volatility, 2),
             'recent_volatility': round(recent_volatility, 2),
-            'max_daily_gain': round(returns.max() * 100, 2),
-            'max_daily_loss': round(returns.min() * 100, 2),
+            'max_daily_gain': round(max_return * 100, 2),
+            'max_daily_loss': round(min_return * 100, 2),
             'risk_level': risk_level,
             'interpretation': f'Annualized volatility of {volatility:.1f}% indicates {"high" if risk_level == "HIGH" else "moderate" if risk_level == "MEDIUM" else "low"} price fluctuation'
         }
@@ -320,42 +510,12 @@ class PatternDetector:
         volatility = self.calculate_volatility_metrics()
         
         # Calculate overall pattern risk score
-        risk_scores = []
-        
-        if volume_spikes['risk_level'] == 'HIGH':
-            risk_scores.append(0.8)
-        elif volume_spikes['risk_level'] == 'MEDIUM':
-            risk_scores.append(0.5)
-        else:
-            risk_scores.append(0.2)
-        
-        if price_anomalies['risk_level'] == 'HIGH':
-            risk_scores.append(0.7)
-        elif price_anomalies['risk_level'] == 'MEDIUM':
-            risk_scores.append(0.4)
-        else:
-            risk_scores.append(0.2)
-        
-        if gap_movements['risk_level'] == 'HIGH':
-            risk_scores.append(0.6)
-        elif gap_movements['risk_level'] == 'MEDIUM':
-            risk_scores.append(0.4)
-        else:
-            risk_scores.append(0.2)
-        
-        if divergence['risk_level'] == 'MEDIUM':
-            risk_scores.append(0.5)
-        else:
-            risk_scores.append(0.2)
-        
-        if volatility['risk_level'] == 'HIGH':
-            risk_scores.append(0.7)
-        elif volatility['risk_level'] == 'MEDIUM':
-            risk_scores.append(0.4)
-        else:
-            risk_scores.append(0.2)
-        
-        overall_risk_score = np.mean(risk_scores)
+        reports = (volume_spikes, price_anomalies, gap_movements, divergence, volatility)
+        risk_scores = [
+            level_scores.get(report['risk_level'], 0.2)
+            for report, level_scores in zip(reports, self._RISK_LEVEL_SCORES)
+        ]
+        overall_risk_score = sum(risk_scores) / len(risk_scores)
         
         return {
             'timestamp': datetime.now().isoformat(),
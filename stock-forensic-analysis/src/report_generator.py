@@ -2,86 +2,141 @@
 Report generation module for creating structured analysis reports
 """
 import json
+import math
 import os
-from typing import Dict, Any
-from datetime import datetime
-from jinja2 import Template
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, Any, List
+from datetime import date, datetime
+import numpy as np
+import pandas as pd
+from jinja2 import Environment
 
 from config import Config
 
+# orjson writes JSON reports several times faster; fall back to the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class ReportGenerator:
-    """Generate analysis reports in various formats"""
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# Buffer size for report file writes (1 MiB)
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Template output pieces joined per chunk when streaming the HTML report
+_HTML_STREAM_CHUNK_SIZE = 64
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    Serialize objects the JSON serializer can't handle natively
     
-    def __init__(self, analysis_data: Dict[str, Any]):
-        """
-        Initialize the report generator
-        
-        Args:
-            analysis_data: Complete analysis data
-        """
-        self.data = analysis_data
-        self.symbol = analysis_data.get('symbol', 'UNKNOWN')
-        self.timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    Datetimes orjson doesn't take natively (e.g. pandas Timestamps) become
+    ISO strings and DataFrames (e.g. holder tables) are converted to a list
+    of row records; everything else falls back to its string representation.
     
-    def generate_json_report(self, output_dir: str = None) -> str:
-        """
-        Generate JSON format report
-        
-        Args:
-            output_dir: Output directory for the report
-            
-        Returns:
-            Path to the generated report
-        """
-        if output_dir is None:
-            output_dir = Config.REPORT_OUTPUT_DIR
-        
-        os.makedirs(output_dir, exist_ok=True)
-        
-        filename = f"{self.symbol}_forensic_analysis_{self.timestamp}.json"
-        filepath = os.path.join(output_dir, filename)
-        
-        with open(filepath, 'w') as f:
-            json.dump(self.data, f, indent=2, default=str)
-        
-        print(f"JSON report saved to: {filepath}")
-        return filepath
+    Args:
+        obj: Object to serialize
+        
+    Returns:
+        JSON-serializable representation
+    """
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, pd.DataFrame):
+        return obj.to_dict(orient='records')
+    return str(obj)
+
+
+def _to_native(obj: Any) -> Any:
+    """
+    Recursively convert analysis data to plain JSON-compatible Python types
     
-    def generate_html_report(self, output_dir: str = None) -> str:
-        """
-        Generate HTML format report
-        
-        Args:
-            output_dir: Output directory for the report
-            
-        Returns:
-            Path to the generated report
-        """
-        if output_dir is None:
-            output_dir = Config.REPORT_OUTPUT_DIR
-        
-        os.makedirs(output_dir, exist_ok=True)
-        
-        html_content = self._create_html_content()
-        
-        filename = f"{self.symbol}_forensic_analysis_{self.timestamp}.html"
-        filepath = os.path.join(output_dir, filename)
-        
-        with open(filepath, 'w') as f:
-            f.write(html_content)
-        
-        print(f"HTML report saved to: {filepath}")
-        return filepath
+    Used for the stdlib json fallback so that serialization needs no default
+    callback. The result serializes to the same JSON values as the orjson
+    path: NumPy scalars and arrays become Python numbers and lists, NaN and
+    infinities become null, datetimes (including datetime64) become ISO
+    strings, DataFrames become row records and anything else unknown becomes
+    its string representation.
     
-    def _create_html_content(self) -> str:
-        """
-        Create HTML content for the report
-        
-        Returns:
-            HTML string
-        """
-        template = """
+    Args:
+        obj: Object to convert
+        
+    Returns:
+        JSON-serializable representation
+    """
+    if obj is None or isinstance(obj, (str, int)):
+        return obj
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _to_native(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_to_native(value) for value in obj]
+    if isinstance(obj, np.datetime64):
+        value = obj.astype('datetime64[us]').item()
+        return value.isoformat() if value is not None else str(obj)
+    if isinstance(obj, np.float32):
+        # Shortest float32 repr, as orjson writes it, not the widened double
+        return _to_native(float(str(obj)))
+    if isinstance(obj, np.generic):
+        return _to_native(obj.item())
+    if isinstance(obj, np.ndarray):
+        if obj.dtype == np.float32:
+            return [_to_native(value) for value in obj]
+        return _to_native(obj.tolist())
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, pd.DataFrame):
+        return _to_native(obj.to_dict(orient='records'))
+    return str(obj)
+
+
+def _write_bytes(filepath: str, payload: bytes) -> None:
+    """
+    Write an encoded report to disk in one buffered call
+    
+    Args:
+        filepath: Destination path
+        payload: Encoded report contents
+    """
+    with open(filepath, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(payload)
+
+
+def _write_html(filepath: str, template_data: Dict[str, Any]) -> None:
+    """
+    Render the HTML report template straight into a file
+    
+    Rendered chunks are streamed into the file buffer instead of
+    materializing the whole page as one string first.
+    
+    Args:
+        filepath: Destination path
+        template_data: Template context
+    """
+    stream = _HTML_TEMPLATE.stream(template_data)
+    stream.enable_buffering(_HTML_STREAM_CHUNK_SIZE)
+    with open(filepath, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+        stream.dump(f, encoding='utf-8')
+
+
+# HTML report template, compiled once at import rather than on every report
+_HTML_TEMPLATE_SRC = """
+{%- macro component_grid(items) %}
+        <div class="component-grid">
+            {% for name, value in items %}
+            <div class="component-item">
+                <div class="component-name">{{ name }}</div>
+                <div class="component-value">{{ value }}</div>
+            </div>
+            {% endfor %}
+        </div>
+{%- endmacro %}
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -306,24 +361,7 @@ class ReportGenerator:
         </div>
         
         <h2>📈 Stock Information</h2>
-        <div class="component-grid">
-            <div class="component-item">
-                <div class="component-name">Current Price</div>
-                <div class="component-value">${{ current_price }}</div>
-            </div>
-            <div class="component-item">
-                <div class="component-name">Market Cap</div>
-                <div class="component-value">{{ market_cap }}</div>
-            </div>
-            <div class="component-item">
-                <div class="component-name">P/E Ratio</div>
-                <div class="component-value">{{ pe_ratio }}</div>
-            </div>
-            <div class="component-item">
-                <div class="component-name">Sector</div>
-                <div class="component-value">{{ sector }}</div>
-            </div>
-        </div>
+        {{ component_grid(stock_components) }}
         
         <h2>🔍 Forensic Analysis</h2>
         
@@ -337,14 +375,7 @@ class ReportGenerator:
         </div>
         
         {% if m_score_components %}
-        <div class="component-grid">
-            {% for key, value in m_score_components.items() %}
-            <div class="component-item">
-                <div class="component-name">{{ key }}</div>
-                <div class="component-value">{{ value }}</div>
-            </div>
-            {% endfor %}
-        </div>
+        {{ component_grid(m_score_components) }}
         {% endif %}
         
         <h3>Altman Z-Score (Bankruptcy Prediction)</h3>
@@ -357,14 +388,7 @@ class ReportGenerator:
         </div>
         
         {% if z_score_components %}
-        <div class="component-grid">
-            {% for key, value in z_score_components.items() %}
-            <div class="component-item">
-                <div class="component-name">{{ key|replace('_', ' ')|title }}</div>
-                <div class="component-value">{{ value }}</div>
-            </div>
-            {% endfor %}
-        </div>
+        {{ component_grid(z_score_components) }}
         {% endif %}
         
         <h2>🚩 Financial Red Flags</h2>
@@ -476,16 +500,207 @@ class ReportGenerator:
     </div>
 </body>
 </html>
+"""
+
+# Line breaks followed by indentation (and blank lines) in the template source;
+# the page has no <pre> blocks, so a bare line break renders the same
+_TEMPLATE_INDENT_RE = re.compile(r'\n\s+')
+
+_HTML_TEMPLATE = Environment(auto_reload=False).from_string(
+    _TEMPLATE_INDENT_RE.sub('\n', _HTML_TEMPLATE_SRC)
+)
+
+
+class ReportGenerator:
+    """Generate analysis reports in various formats"""
+    
+    # Worker threads for background report writes (shared by all generators),
+    # and the background writes not yet waited for by flush(), guarded by
+    # _pending_lock since generators on any thread may queue writes
+    _IO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='report-writer')
+    _pending_writes: List[Future] = []
+    _pending_lock = threading.Lock()
+    
+    def __init__(self, analysis_data: Dict[str, Any]):
         """
+        Initialize the report generator
+        
+        Args:
+            analysis_data: Complete analysis data
+        """
+        self.data = analysis_data
+        self.symbol = analysis_data.get('symbol', 'UNKNOWN')
         
-        # Prepare data for template
-        stock_info = self.data.get('stock_info', {})
-        forensic = self.data.get('forensic_analysis', {})
-        patterns = self.data.get('pattern_analysis', {})
-        news = self.data.get('news_analysis', {})
+        # Generation time, read once: file-name stamp and display form
+        now = datetime.now()
+        self.timestamp = now.strftime('%Y%m%d_%H%M%S')
+        self._display_date = now.strftime('%Y-%m-%d %H:%M:%S')
+        
+        # Report sections looked up once and shared by every report format
+        self._stock = analysis_data.get('stock_info', {})
+        self._forensic = analysis_data.get('forensic_analysis', {})
+        self._news = analysis_data.get('news_analysis', {})
+        self._patterns = analysis_data.get('pattern_analysis', {})
+        self._m = self._forensic.get('beneish_m_score', {})
+        self._z = self._forensic.get('altman_z_score', {})
+        
+        # Executive summary and the shallow HTML template context flattened
+        # from the analysis data, built on first use
+        self._executive_summary = None
+        self._ctx_base = None
+        
+        # Analysis data converted to plain Python types for the stdlib json
+        # fallback, built on first use
+        self._json_data = None
+    
+    def generate_json_report(self, output_dir: str = None, background: bool = False) -> str:
+        """
+        Generate JSON format report
+        
+        Args:
+            output_dir: Output directory for the report
+            background: Write the file on the writer pool (see flush())
+            
+        Returns:
+            Path to the generated report
+        """
+        if output_dir is None:
+            output_dir = Config.REPORT_OUTPUT_DIR
+        
+        os.makedirs(output_dir, exist_ok=True)
+        
+        filename = f"{self.symbol}_forensic_analysis_{self.timestamp}.json"
+        filepath = os.path.join(output_dir, filename)
+        
+        # Serialize here so the report data isn't shared with the writer thread
+        if orjson is not None:
+            # Numpy scalars and datetimes are serialized natively; only other
+            # objects go through _json_default
+            payload = orjson.dumps(self.data, option=_ORJSON_OPTIONS, default=_json_default)
+        else:
+            # Normalized once per generator, then dumped without a default callback
+            if self._json_data is None:
+                self._json_data = _to_native(self.data)
+            payload = json.dumps(self._json_data, indent=2).encode('utf-8')
+        
+        self._write('JSON', filepath, background, _write_bytes, filepath, payload)
+        return filepath
+    
+    def generate_html_report(self, output_dir: str = None, background: bool = False) -> str:
+        """
+        Generate HTML format report
+        
+        Args:
+            output_dir: Output directory for the report
+            background: Render and write the file on the writer pool (see flush())
+            
+        Returns:
+            Path to the generated report
+        """
+        if output_dir is None:
+            output_dir = Config.REPORT_OUTPUT_DIR
+        
+        os.makedirs(output_dir, exist_ok=True)
+        
+        filename = f"{self.symbol}_forensic_analysis_{self.timestamp}.html"
+        filepath = os.path.join(output_dir, filename)
+        
+        self._write('HTML', filepath, background, _write_html, filepath, self._html_template_data())
+        return filepath
+    
+    def _write(self, kind: str, filepath: str, background: bool, writer, *args) -> None:
+        """
+        Run a report writer now, or queue it on the writer pool
+        
+        Args:
+            kind: Report kind for the progress message
+            filepath: Destination path
+            background: Queue the write instead of waiting for it
+            writer: Function performing the write
+            *args: Arguments for the writer
+        """
+        if background:
+            self._queue(self._IO_POOL.submit(writer, *args))
+            print(f"{kind} report queued for writing: {filepath}")
+        else:
+            writer(*args)
+            print(f"{kind} report saved to: {filepath}")
+    
+    @classmethod
+    def _queue(cls, future: Future) -> None:
+        """
+        Track a background write until flush() waits for it
+        
+        Writes that already finished successfully are dropped so the list
+        doesn't grow without bound when flush() is never called; failed
+        writes are kept so flush() can still report them.
+        
+        Args:
+            future: Future of the queued write
+        """
+        with cls._pending_lock:
+            pending = [f for f in cls._pending_writes
+                       if not f.done() or f.exception() is not None]
+            pending.append(future)
+            cls._pending_writes = pending
+    
+    @classmethod
+    def flush(cls) -> None:
+        """Wait for all background report writes, re-raising the first error"""
+        with cls._pending_lock:
+            pending, cls._pending_writes = cls._pending_writes, []
+        
+        # Let every write finish before reporting a failure, so none is left
+        # running untracked
+        wait(pending)
+        for future in pending:
+            future.result()
+    
+    def _create_html_content(self) -> str:
+        """
+        Create HTML content for the report
+        
+        Returns:
+            HTML string
+        """
+        return _HTML_TEMPLATE.render(self._html_template_data())
+    
+    def _html_template_data(self) -> Dict[str, Any]:
+        """
+        Build the context for the HTML report template
+        
+        Returns:
+            Dictionary of template variables
+        """
+        if self._ctx_base is None:
+            self._ctx_base = self._flatten()
+        
+        template_data = dict(self._ctx_base)
+        template_data['analysis_date'] = self._display_date
+        template_data['executive_summary'] = self._generate_executive_summary()
+        return template_data
+    
+    def _flatten(self) -> Dict[str, Any]:
+        """
+        Flatten the analysis data into the HTML template's fields
+        
+        Every field that depends only on the analysis data is resolved here,
+        once per generator; rendering only adds the analysis date and the
+        executive summary.
+        
+        Returns:
+            Dictionary of template variables (without executive_summary and
+            analysis_date)
+        """
+        pledge = self._forensic.get('promoter_pledge_analysis', {})
+        volume_spikes = self._patterns.get('volume_spikes', {})
+        price_anomalies = self._patterns.get('price_anomalies', {})
+        volatility = self._patterns.get('volatility_metrics', {})
+        sentiment = self._news.get('sentiment_analysis', {})
+        risk_signals = self._news.get('risk_signals', {})
         
         # Format market cap
-        market_cap = stock_info.get('market_cap', 0)
+        market_cap = self._stock.get('market_cap', 0)
         if market_cap >= 1e9:
             market_cap_str = f"${market_cap/1e9:.2f}B"
         elif market_cap >= 1e6:
@@ -493,67 +708,63 @@ class ReportGenerator:
         else:
             market_cap_str = f"${market_cap:,.0f}"
         
-        # Generate executive summary
-        executive_summary = self._generate_executive_summary()
-        
-        template_data = {
+        return {
             'symbol': self.symbol,
-            'company_name': stock_info.get('company_name', 'N/A'),
-            'analysis_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'company_name': self._stock.get('company_name', 'N/A'),
             'overall_risk_level': self.data.get('overall_risk_level', 'UNKNOWN'),
             'overall_risk_score': self.data.get('overall_risk_score', 0),
-            'executive_summary': executive_summary,
             
-            # Stock info
-            'current_price': stock_info.get('current_price', 0),
-            'market_cap': market_cap_str,
-            'pe_ratio': stock_info.get('pe_ratio', 'N/A'),
-            'sector': stock_info.get('sector', 'N/A'),
+            # Stock info, as (name, value) pairs for the component_grid macro
+            'stock_components': (
+                ('Current Price', f"${self._stock.get('current_price', 0)}"),
+                ('Market Cap', market_cap_str),
+                ('P/E Ratio', self._stock.get('pe_ratio', 'N/A')),
+                ('Sector', self._stock.get('sector', 'N/A')),
+            ),
             
             # Forensic scores
-            'm_score': forensic.get('beneish_m_score', {}).get('score', 'N/A'),
-            'm_score_risk': forensic.get('beneish_m_score', {}).get('risk_level', 'UNKNOWN'),
-            'm_score_interpretation': forensic.get('beneish_m_score', {}).get('interpretation', ''),
-            'm_score_components': forensic.get('beneish_m_score', {}).get('components', {}),
+            'm_score': self._m.get('score', 'N/A'),
+            'm_score_risk': self._m.get('risk_level', 'UNKNOWN'),
+            'm_score_interpretation': self._m.get('interpretation', ''),
+            'm_score_components': list(self._m.get('components', {}).items()),
             
-            'z_score': forensic.get('altman_z_score', {}).get('score', 'N/A'),
-            'z_score_risk': forensic.get('altman_z_score', {}).get('risk_level', 'UNKNOWN'),
-            'z_score_interpretation': forensic.get('altman_z_score', {}).get('interpretation', ''),
-            'z_score_components': forensic.get('altman_z_score', {}).get('components', {}),
+            'z_score': self._z.get('score', 'N/A'),
+            'z_score_risk': self._z.get('risk_level', 'UNKNOWN'),
+            'z_score_interpretation': self._z.get('interpretation', ''),
+            'z_score_components': [
+                (key.replace('_', ' ').title(), value)
+                for key, value in self._z.get('components', {}).items()
+            ],
             
             # Red flags
-            'red_flags': forensic.get('financial_red_flags', {}).get('red_flags', []),
+            'red_flags': self._forensic.get('financial_red_flags', {}).get('red_flags', []),
             
             # Shareholding
-            'insider_ownership': forensic.get('promoter_pledge_analysis', {}).get('insider_ownership_percent', 0),
-            'institutional_ownership': forensic.get('promoter_pledge_analysis', {}).get('institutional_ownership_percent', 0),
-            'shareholding_risk': forensic.get('promoter_pledge_analysis', {}).get('risk_level', 'UNKNOWN'),
-            'shareholding_flags': forensic.get('promoter_pledge_analysis', {}).get('red_flags', []),
+            'insider_ownership': pledge.get('insider_ownership_percent', 0),
+            'institutional_ownership': pledge.get('institutional_ownership_percent', 0),
+            'shareholding_risk': pledge.get('risk_level', 'UNKNOWN'),
+            'shareholding_flags': pledge.get('red_flags', []),
             
             # Patterns
-            'volume_spikes_count': patterns.get('volume_spikes', {}).get('spikes_detected', 0),
-            'volume_risk': patterns.get('volume_spikes', {}).get('risk_level', 'UNKNOWN'),
-            'price_anomalies_count': patterns.get('price_anomalies', {}).get('anomalies_detected', 0),
-            'price_anomaly_risk': patterns.get('price_anomalies', {}).get('risk_level', 'UNKNOWN'),
-            'volatility': patterns.get('volatility_metrics', {}).get('annualized_volatility', 0),
-            'volatility_risk': patterns.get('volatility_metrics', {}).get('risk_level', 'UNKNOWN'),
+            'volume_spikes_count': volume_spikes.get('spikes_detected', 0),
+            'volume_risk': volume_spikes.get('risk_level', 'UNKNOWN'),
+            'price_anomalies_count': price_anomalies.get('anomalies_detected', 0),
+            'price_anomaly_risk': price_anomalies.get('risk_level', 'UNKNOWN'),
+            'volatility': volatility.get('annualized_volatility', 0),
+            'volatility_risk': volatility.get('risk_level', 'UNKNOWN'),
             
             # News
-            'news_sentiment': news.get('sentiment_analysis', {}).get('sentiment', 'NEUTRAL'),
-            'news_sentiment_score': news.get('sentiment_analysis', {}).get('sentiment_score', 0),
-            'news_count': news.get('total_articles_analyzed', 0),
-            'high_risk_news_count': len(news.get('risk_signals', {}).get('high_risk', [])),
-            'medium_risk_news_count': len(news.get('risk_signals', {}).get('medium_risk', [])),
-            'news_risk': news.get('risk_signals', {}).get('risk_level', 'UNKNOWN'),
-            'critical_news': news.get('critical_news', [])[:5],  # Top 5 critical news
+            'news_sentiment': sentiment.get('sentiment', 'NEUTRAL'),
+            'news_sentiment_score': sentiment.get('sentiment_score', 0),
+            'news_count': self._news.get('total_articles_analyzed', 0),
+            'high_risk_news_count': len(risk_signals.get('high_risk', [])),
+            'medium_risk_news_count': len(risk_signals.get('medium_risk', [])),
+            'news_risk': risk_signals.get('risk_level', 'UNKNOWN'),
+            'critical_news': self._news.get('critical_news', [])[:5],  # Top 5 critical news
             
             # Key ratios
             'key_ratios': self.data.get('key_ratios', {}),
         }
-        
-        # Render template
-        tmpl = Template(template)
-        return tmpl.render(**template_data)
     
     def _generate_executive_summary(self) -> str:
         """
@@ -562,16 +773,20 @@ class ReportGenerator:
         Returns:
             Executive summary string
         """
+        if self._executive_summary is None:
+            self._executive_summary = self._compute_executive_summary()
+        return self._executive_summary
+    
+    def _compute_executive_summary(self) -> str:
+        """Compose the executive summary (uncached)"""
         symbol = self.symbol
         overall_risk = self.data.get('overall_risk_level', 'UNKNOWN')
         
-        forensic = self.data.get('forensic_analysis', {})
-        m_score_risk = forensic.get('beneish_m_score', {}).get('risk_level', 'UNKNOWN')
-        z_score_risk = forensic.get('altman_z_score', {}).get('risk_level', 'UNKNOWN')
-        red_flags_count = forensic.get('financial_red_flags', {}).get('total_flags', 0)
+        m_score_risk = self._m.get('risk_level', 'UNKNOWN')
+        z_score_risk = self._z.get('risk_level', 'UNKNOWN')
+        red_flags_count = self._forensic.get('financial_red_flags', {}).get('total_flags', 0)
         
-        news = self.data.get('news_analysis', {})
-        news_sentiment = news.get('sentiment_analysis', {}).get('sentiment', 'NEUTRAL')
+        news_sentiment = self._news.get('sentiment_analysis', {}).get('sentiment', 'NEUTRAL')
         
         summary_parts = [
             f"Forensic analysis of {symbol} reveals an overall risk level of {overall_risk}."
@@ -604,7 +819,7 @@ class ReportGenerator:
         lines.append("=" * 80)
         lines.append(f"STOCK FORENSIC ANALYSIS REPORT - {self.symbol}")
         lines.append("=" * 80)
-        lines.append(f"Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        lines.append(f"Analysis Date: {self._display_date}")
         lines.append(f"Overall Risk Level: {self.data.get('overall_risk_level', 'UNKNOWN')}")
         lines.append(f"Overall Risk Score: {self.data.get('overall_risk_score', 0):.2f}")
         lines.append("")
@@ -612,22 +827,20 @@ class ReportGenerator:
         # Forensic Analysis
         lines.append("FORENSIC ANALYSIS")
         lines.append("-" * 80)
-        forensic = self.data.get('forensic_analysis', {})
-        
-        m_score = forensic.get('beneish_m_score', {})
+        m_score = self._m
         lines.append(f"Beneish M-Score: {m_score.get('score', 'N/A')} ({m_score.get('risk_level', 'UNKNOWN')})")
         
-        z_score = forensic.get('altman_z_score', {})
+        z_score = self._z
         lines.append(f"Altman Z-Score: {z_score.get('score', 'N/A')} ({z_score.get('risk_level', 'UNKNOWN')})")
         
-        red_flags = forensic.get('financial_red_flags', {})
+        red_flags = self._forensic.get('financial_red_flags', {})
         lines.append(f"Financial Red Flags: {red_flags.get('total_flags', 0)}")
         lines.append("")
         
         # News Analysis
         lines.append("NEWS ANALYSIS")
         lines.append("-" * 80)
-        news = self.data.get('news_analysis', {})
+        news = self._news
         sentiment = news.get('sentiment_analysis', {})
         lines.append(f"Sentiment: {sentiment.get('sentiment', 'NEUTRAL')} (Score: {sentiment.get('sentiment_score', 0)})")
         lines.append(f"Articles Analyzed: {news.get('total_articles_analyzed', 0)}")
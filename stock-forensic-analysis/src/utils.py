@@ -1,10 +1,47 @@
 """
 Utility functions for data processing and analysis
 """
+import sys
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, TextIO
+
+# Numba is optional: without it, @njit-decorated kernels run as plain Python
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+    
+    prange = range
+
+
+def _is_missing(value: Any) -> bool:
+    """
+    Scalar missing-value test
+    
+    Python ints and floats (and np.float64, which subclasses float) are
+    checked with the NaN self-inequality test; anything else (None, pd.NA,
+    NaT, other NumPy scalars such as np.int64 or np.float32, ...) goes
+    through pd.isna.
+    
+    Args:
+        value: Scalar to test
+        
+    Returns:
+        True if the value is missing
+    """
+    if isinstance(value, (float, int)):
+        return value != value
+    return pd.isna(value)
 
 
 def clean_financial_data(df: pd.DataFrame) -> pd.DataFrame:
@@ -20,13 +57,9 @@ def clean_financial_data(df: pd.DataFrame) -> pd.DataFrame:
     if df is None or df.empty:
         return pd.DataFrame()
     
-    # Remove rows with all NaN values
-    df = df.dropna(how='all')
-    
-    # Forward fill missing values (common in financial data)
-    df = df.fillna(method='ffill', limit=2)
-    
-    return df
+    # Remove rows with all NaN values, then forward fill missing values
+    # (common in financial data)
+    return df.dropna(how='all').ffill(limit=2)
 
 
 def calculate_percentage_change(current: float, previous: float) -> float:
@@ -40,7 +73,7 @@ def calculate_percentage_change(current: float, previous: float) -> float:
     Returns:
         Percentage change
     """
-    if previous == 0 or pd.isna(previous) or pd.isna(current):
+    if previous == 0 or _is_missing(previous) or _is_missing(current):
         return 0.0
     
     return ((current - previous) / abs(previous)) * 100
@@ -58,12 +91,61 @@ def safe_divide(numerator: float, denominator: float, default: float = 0.0) -> f
     Returns:
         Division result or default value
     """
-    if denominator == 0 or pd.isna(denominator) or pd.isna(numerator):
+    if denominator == 0 or _is_missing(denominator) or _is_missing(numerator):
         return default
     
     return numerator / denominator
 
 
+@njit(cache=True)
+def safe_divide_array(numerators: np.ndarray, denominators: np.ndarray,
+                      default: float) -> np.ndarray:
+    """
+    Element-wise safe_divide: default wherever the denominator is zero or
+    either operand is NaN
+    
+    Args:
+        numerators: Numerator values
+        denominators: Denominator values
+        default: Value used where the division is not possible
+        
+    Returns:
+        Array of quotients
+    """
+    valid = (denominators != 0) & ~np.isnan(numerators) & ~np.isnan(denominators)
+    # Invalid slots divide by 1.0 instead, so no zero-division ever happens
+    return np.where(valid, numerators / np.where(valid, denominators, 1.0), default)
+
+
+@njit(cache=True)
+def percentage_change_array(current: np.ndarray, previous: np.ndarray) -> np.ndarray:
+    """
+    Element-wise calculate_percentage_change: 0.0 wherever the previous
+    value is zero or either value is NaN
+    
+    Args:
+        current: Current values
+        previous: Previous values
+        
+    Returns:
+        Array of percentage changes
+    """
+    valid = (previous != 0) & ~np.isnan(previous) & ~np.isnan(current)
+    # Invalid slots divide by 1.0 instead, so no zero-division ever happens
+    return np.where(valid, ((current - previous) / np.abs(np.where(valid, previous, 1.0))) * 100, 0.0)
+
+
+# Number of days covered by each period string
+_PERIOD_DAYS = MappingProxyType({
+    '1m': 30,
+    '3m': 90,
+    '6m': 180,
+    '1y': 365,
+    '2y': 730,
+    '5y': 1825
+})
+
+
 def get_date_range(period: str = '1y') -> tuple:
     """
     Get start and end dates for a given period
@@ -76,16 +158,7 @@ def get_date_range(period: str = '1y') -> tuple:
     """
     end_date = datetime.now()
     
-    period_map = {
-        '1m': 30,
-        '3m': 90,
-        '6m': 180,
-        '1y': 365,
-        '2y': 730,
-        '5y': 1825
-    }
-    
-    days = period_map.get(period, 365)
+    days = _PERIOD_DAYS.get(period, 365)
     start_date = end_date - timedelta(days=days)
     
     return start_date, end_date
@@ -102,7 +175,23 @@ def calculate_moving_average(data: pd.Series, window: int) -> pd.Series:
     Returns:
         Moving average series
     """
-    return data.rolling(window=window, min_periods=1).mean()
+    # Rolling sums from prefix sums: one cumsum for the values and one for
+    # the count of non-missing values (partial windows at the start). Values
+    # are shifted by their mean first to limit cancellation in the sums.
+    values = data.to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = ~np.isnan(values)
+    shift = values[valid].mean() if valid.any() else 0.0
+    
+    prefix_sums = np.zeros(len(values) + 1)
+    np.cumsum(np.where(valid, values - shift, 0.0), out=prefix_sums[1:])
+    prefix_counts = np.zeros(len(values) + 1)
+    np.cumsum(valid, out=prefix_counts[1:])
+    
+    ends = np.arange(1, len(values) + 1)
+    starts = np.maximum(ends - window, 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        averages = (prefix_sums[ends] - prefix_sums[starts]) / (prefix_counts[ends] - prefix_counts[starts])
+    return pd.Series(averages + shift, index=data.index, name=data.name)
 
 
 def detect_outliers(data: pd.Series, threshold: float = 3.0) -> pd.Series:
@@ -116,11 +205,22 @@ def detect_outliers(data: pd.Series, threshold: float = 3.0) -> pd.Series:
     Returns:
         Boolean series indicating outliers
     """
-    if len(data) < 2:
-        return pd.Series([False] * len(data), index=data.index)
+    values = data.to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = values[~np.isnan(values)]
+    if len(valid) < 2:
+        return pd.Series(False, index=data.index)
     
-    z_scores = np.abs((data - data.mean()) / data.std())
-    return z_scores > threshold
+    # |x - mean| > threshold * std is the z-score test without the division
+    # (missing values compare False, as do all values when std is zero)
+    mean = valid.mean()
+    std = valid.std(ddof=1)
+    if std == 0:
+        return pd.Series(False, index=data.index)
+    return pd.Series(np.abs(values - mean) > threshold * std, index=data.index)
+
+
+# Currency magnitudes and their suffixes, largest first
+_CURRENCY_SCALES = ((1e9, 'B'), (1e6, 'M'), (1e3, 'K'))
 
 
 def format_currency(value: float, currency: str = 'USD') -> str:
@@ -134,17 +234,14 @@ def format_currency(value: float, currency: str = 'USD') -> str:
     Returns:
         Formatted currency string
     """
-    if pd.isna(value):
+    if _is_missing(value):
         return "N/A"
     
-    if abs(value) >= 1e9:
-        return f"${value/1e9:.2f}B"
-    elif abs(value) >= 1e6:
-        return f"${value/1e6:.2f}M"
-    elif abs(value) >= 1e3:
-        return f"${value/1e3:.2f}K"
-    else:
-        return f"${value:.2f}"
+    magnitude = abs(value)
+    for scale, suffix in _CURRENCY_SCALES:
+        if magnitude >= scale:
+            return f"${value / scale:.2f}{suffix}"
+    return f"${value:.2f}"
 
 
 def format_percentage(value: float, decimals: int = 2) -> str:
@@ -158,7 +255,7 @@ def format_percentage(value: float, decimals: int = 2) -> str:
     Returns:
         Formatted percentage string
     """
-    if pd.isna(value):
+    if _is_missing(value):
         return "N/A"
     
     return f"{value:.{decimals}f}%"
@@ -185,6 +282,10 @@ def get_risk_level(score: float, high_threshold: float = 0.7,
         return "LOW"
 
 
+# Strips currency formatting; accounting-style "(x)" becomes "-x"
+_FINANCIAL_STRIP_TABLE = str.maketrans({'$': '', ',': '', '%': '', '(': '-', ')': ''})
+
+
 def extract_financial_value(value: Any) -> float:
     """
     Extract numeric value from various financial data formats
@@ -195,16 +296,12 @@ def extract_financial_value(value: Any) -> float:
     Returns:
         Numeric value
     """
-    if pd.isna(value):
-        return 0.0
-    
     if isinstance(value, (int, float)):
-        return float(value)
+        return 0.0 if value != value else float(value)
     
     if isinstance(value, str):
         # Remove common currency symbols and formatting
-        value = value.replace('$', '').replace(',', '').replace('%', '')
-        value = value.replace('(', '-').replace(')', '')
+        value = value.translate(_FINANCIAL_STRIP_TABLE)
         
         try:
             return float(value)
@@ -227,17 +324,45 @@ def calculate_growth_rate(values: list) -> float:
     if len(values) < 2:
         return 0.0
     
-    values = [v for v in values if not pd.isna(v) and v > 0]
+    # Coerce to float64 (None/pd.NA become NaN), then keep finite positive values
+    values = pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(dtype=np.float64)
+    values = values[np.isfinite(values) & (values > 0)]
     
     if len(values) < 2:
         return 0.0
     
-    start_value = values[0]
-    end_value = values[-1]
     periods = len(values) - 1
+    cagr = ((float(values[-1]) / float(values[0])) ** (1 / periods) - 1) * 100
+    return cagr
+
+
+class ProgressReporter:
+    """Buffer console progress lines and write them in a single call"""
     
-    if start_value <= 0:
-        return 0.0
+    def __init__(self, stream: Optional[TextIO] = None):
+        """
+        Initialize the progress reporter
+        
+        Args:
+            stream: Output stream (defaults to sys.stdout)
+        """
+        self.stream = stream or sys.stdout
+        self._lines: List[str] = []
     
-    cagr = (pow(end_value / start_value, 1 / periods) - 1) * 100
-    return cagr
+    def emit(self, line: str = "") -> None:
+        """
+        Queue a progress line for output
+        
+        Args:
+            line: Line of text (without trailing newline)
+        """
+        self._lines.append(line)
+    
+    def flush(self) -> None:
+        """Write all queued lines to the stream at once"""
+        if not self._lines:
+            return
+        
+        self.stream.write("\n".join(self._lines) + "\n")
+        self.stream.flush()
+        self._lines.clear()